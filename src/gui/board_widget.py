@@ -9,10 +9,23 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
-from PySide6.QtCore import QRectF, Qt
-from PySide6.QtGui import QBrush, QColor, QPainter, QPen
+from PySide6.QtCore import QLine, QRect, Qt
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QWidget
 
+from src.logic.bitmask import iter_bits
+
+# Colors and pens are built once instead of being parsed per cell per repaint
+_BLOCKED_COLOR = QColor("#333333")
+_EMPTY_COLOR = QColor("#FFFFFF")
+_GRID_PEN = QPen(QColor("#888888"), 1)
+_ATTEMPT_BRUSH = QBrush(QColor(255, 0, 0, 128))  # Red with transparency
+_ATTEMPT_PEN = QPen(QColor("#FF0000"), 2)
+
+# Piece colors by hue in degrees; a piece's hue is derived from its integer
+# id, so at most 360 colors are ever built
+_PIECE_COLORS: dict[int, QColor] = {}
+
 
 class BoardWidget(QWidget):
     """Renders puzzle board state using QPainter.
@@ -54,6 +67,16 @@ class BoardWidget(QWidget):
             None  # current_position from event
         )
 
+        # Grid geometry only depends on the cell size, so it is kept across
+        # repaints and rebuilt lazily after a resize
+        self._grid_line_cache: Optional[list[QLine]] = None
+        self._cell_origin_cache: Optional[list[tuple[int, int]]] = None
+
+        # Empty cells, blocked cells and grid lines pre-rendered together,
+        # keyed by (cell size, device pixel ratio, blocked mask)
+        self._background: Optional[QPixmap] = None
+        self._background_key: Optional[tuple[int, float, int]] = None
+
     def set_cell_size(self, cell_size: int) -> None:
         """Update the cell size and recalculate widget size.
 
@@ -61,6 +84,9 @@ class BoardWidget(QWidget):
             cell_size: New pixel size for each cell
         """
         self._cell_size = cell_size
+        self._grid_line_cache = None
+        self._cell_origin_cache = None
+        self._background = None
         self.setMinimumSize(
             self._width * cell_size + 2,
             self._height * cell_size + 2,
@@ -87,38 +113,101 @@ class BoardWidget(QWidget):
         if self._board is None:
             return
 
+        # Everything is drawn on whole pixels with opaque colors, so painting
+        # without antialiasing skips per-pixel coverage blending
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Draw each cell
-        for row in range(self._height):
-            for col in range(self._width):
-                rect = QRectF(
-                    col * self._cell_size + 1,
-                    row * self._cell_size + 1,
-                    self._cell_size - 2,
-                    self._cell_size - 2,
-                )
-
-                # Determine cell state
-                if self._board.is_blocked((row, col)):
-                    color = QColor("#333333")  # Blocked cells
-                else:
-                    piece_id = self._board.get_piece_at((row, col))
-                    if piece_id is not None:
-                        color = self._get_piece_color(piece_id)
-                    else:
-                        color = QColor("#FFFFFF")  # Empty cells
-
-                # Draw cell background
-                painter.fillRect(rect, color)
-                painter.setPen(QPen(QColor("#888888"), 1))
-                painter.drawRect(rect)
+
+        # Empty cells, blocked cells and grid lines come from one cached pixmap
+        painter.drawPixmap(0, 0, self._background_pixmap())
+
+        # Fill only the cells covered by pieces, looking each one up on the
+        # board; fills stay inside the grid lines, so they need no redrawing
+        board = self._board
+        origins = self._cell_origins()
+        fill_size = self._cell_size - 1
+        for index in iter_bits(board.occupied_mask & ~board.blocked_mask):
+            x, y = origins[index]
+            piece_id = board.get_piece_at(divmod(index, self._width))
+            painter.fillRect(
+                x, y, fill_size, fill_size, self._get_piece_color(piece_id)
+            )
 
         # Draw current piece being attempted (if any)
         if self._current_piece and self._current_position:
             self._draw_current_piece(painter)
 
+    def _background_pixmap(self) -> QPixmap:
+        """Get the board without pieces: empty cells, blocked cells and grid.
+
+        The pixmap is rebuilt only when the cell size, the screen's pixel
+        ratio or the board's blocked cells change.
+
+        Returns:
+            Pixmap covering the whole grid, lines included
+        """
+        ratio = self.devicePixelRatioF()
+        blocked_mask = self._board.blocked_mask
+        key = (self._cell_size, ratio, blocked_mask)
+        if self._background is not None and self._background_key == key:
+            return self._background
+
+        size = self._cell_size
+        # Lines sit on multiples of the cell size, so the far ones need one
+        # extra pixel
+        logical_width = self._width * size + 1
+        logical_height = self._height * size + 1
+        pixmap = QPixmap(round(logical_width * ratio), round(logical_height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(_EMPTY_COLOR)
+
+        painter = QPainter(pixmap)
+        origins = self._cell_origins()
+        for index in iter_bits(blocked_mask):
+            x, y = origins[index]
+            painter.fillRect(x, y, size - 1, size - 1, _BLOCKED_COLOR)
+        painter.setPen(_GRID_PEN)
+        painter.drawLines(self._grid_lines())
+        painter.end()
+
+        self._background = pixmap
+        self._background_key = key
+        return pixmap
+
+    def _grid_lines(self) -> list[QLine]:
+        """Get the lines separating the cells at the current cell size.
+
+        Returns:
+            One line per row boundary and per column boundary (cached)
+        """
+        if self._grid_line_cache is not None:
+            return self._grid_line_cache
+
+        size = self._cell_size
+        right = self._width * size
+        bottom = self._height * size
+        lines = [
+            QLine(0, row * size, right, row * size) for row in range(self._height + 1)
+        ]
+        lines.extend(
+            QLine(col * size, 0, col * size, bottom) for col in range(self._width + 1)
+        )
+        self._grid_line_cache = lines
+        return lines
+
+    def _cell_origins(self) -> list[tuple[int, int]]:
+        """Get the pixel position of each cell's interior at the current size.
+
+        Returns:
+            (x, y) inside the grid lines, indexed by row * width + col (cached)
+        """
+        if self._cell_origin_cache is None:
+            size = self._cell_size
+            xs = [col * size + 1 for col in range(self._width)]
+            self._cell_origin_cache = [
+                (x, row * size + 1) for row in range(self._height) for x in xs
+            ]
+        return self._cell_origin_cache
+
     def _get_piece_color(self, piece_id: int) -> QColor:
         """Get color for a piece based on its ID.
 
@@ -128,9 +217,12 @@ class BoardWidget(QWidget):
         Returns:
             QColor for this piece
         """
-        # Generate color from piece_id using HSL
+        # Generate color from piece_id using HSL, building each hue only once
         hue = abs(piece_id) % 360
-        return QColor.fromHslF(hue / 360, 0.7, 0.6)
+        color = _PIECE_COLORS.get(hue)
+        if color is None:
+            color = _PIECE_COLORS[hue] = QColor.fromHslF(hue / 360, 0.7, 0.6)
+        return color
 
     def _draw_current_piece(self, painter: QPainter) -> None:
         """Draw the current piece being attempted (with transparency).
@@ -143,21 +235,19 @@ class BoardWidget(QWidget):
 
         row_offset, col_offset = self._current_position
         shape = self._current_piece.canonical_shape
+        origins = self._cell_origins()
+        size = self._cell_size - 2
 
-        # Semi-transparent color for "tentative" piece
-        color = QColor(255, 0, 0, 128)  # Red with transparency
-
+        rects = []
         for cell_row, cell_col in shape:
             row = row_offset + cell_row
             col = col_offset + cell_col
 
             if 0 <= row < self._height and 0 <= col < self._width:
-                rect = QRectF(
-                    col * self._cell_size + 1,
-                    row * self._cell_size + 1,
-                    self._cell_size - 2,
-                    self._cell_size - 2,
-                )
-                painter.fillRect(rect, color)
-                painter.setPen(QPen(QColor("#FF0000"), 2))
-                painter.drawRect(rect)
+                x, y = origins[row * self._width + col]
+                rects.append(QRect(x, y, size, size))
+
+        # Fill and outline every cell in a single call
+        painter.setPen(_ATTEMPT_PEN)
+        painter.setBrush(_ATTEMPT_BRUSH)
+        painter.drawRects(rects)
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
-from PySide6.QtCore import QSize, Qt, Signal
+from PySide6.QtCore import QLine, QRect, QSize, Qt, Signal
 from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPen, QResizeEvent
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -43,7 +43,9 @@ class PieceGridWidget(QWidget):
     MAX_CELL_SIZE = 50
     DEFAULT_CELL_SIZE = 30
     FILL_COLOR = QColor(0, 123, 255)  # Blue for filled cells
+    EMPTY_COLOR = QColor(255, 255, 255)  # White for empty cells
     GRID_COLOR = QColor(180, 180, 180)  # Medium gray for grid lines
+    GRID_PEN = QPen(GRID_COLOR, 1)
 
     def __init__(self, parent: QWidget | None = None) -> None:
         """Initialize the piece grid widget.
@@ -174,38 +176,35 @@ class PieceGridWidget(QWidget):
     def paintEvent(self, event: QPaintEvent) -> None:
         """Paint the grid."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Extra padding for labels
-        label_padding = 25
         grid_width = self._grid_width * self._cell_size
         grid_height = self._grid_height * self._cell_size
-        offset_x = (self.width() - grid_width) // 2
-        offset_y = (self.height() - grid_height) // 2
-
-        # Ensure labels have enough space
-        offset_x = max(offset_x, label_padding)
-        offset_y = max(offset_y, label_padding)
-
-        # Draw cells
-        for row in range(self._grid_height):
-            for col in range(self._grid_width):
-                x = offset_x + col * self._cell_size
-                y = offset_y + row * self._cell_size
-
-                # Determine cell color
-                if (row, col) in self._filled_cells:
-                    color = self.FILL_COLOR
-                else:
-                    color = QColor(255, 255, 255)
-
-                painter.fillRect(x, y, self._cell_size, self._cell_size, color)
+        offset_x, offset_y = self._grid_offset()
+
+        # Fill the whole grid once, then only the filled cells on top
+        size = self._cell_size
+        painter.fillRect(offset_x, offset_y, grid_width, grid_height, self.EMPTY_COLOR)
+        for row, col in self._filled_cells:
+            if row < self._grid_height and col < self._grid_width:
+                painter.fillRect(
+                    offset_x + col * size,
+                    offset_y + row * size,
+                    size,
+                    size,
+                    self.FILL_COLOR,
+                )
 
-                # Draw grid lines
-                pen = QPen(self.GRID_COLOR)
-                pen.setWidth(1)
-                painter.setPen(pen)
-                painter.drawRect(x, y, self._cell_size, self._cell_size)
+        # Draw all grid lines in a single batched call
+        right = offset_x + grid_width
+        bottom = offset_y + grid_height
+        lines = [
+            QLine(offset_x, y, right, y) for y in range(offset_y, bottom + 1, size)
+        ]
+        lines.extend(
+            QLine(x, offset_y, x, bottom) for x in range(offset_x, right + 1, size)
+        )
+        painter.setPen(self.GRID_PEN)
+        painter.drawLines(lines)
 
         # Draw row/column labels if cells are large enough
         if self._cell_size >= 20:
@@ -236,6 +235,34 @@ class PieceGridWidget(QWidget):
                     label,
                 )
 
+    def _grid_offset(self) -> tuple[int, int]:
+        """Get the widget coordinates of the grid's top-left corner as painted.
+
+        Returns:
+            (x, y) offset of the grid, centered but leaving room for labels
+        """
+        # Extra padding for labels
+        label_padding = 25
+        offset_x = (self.width() - self._grid_width * self._cell_size) // 2
+        offset_y = (self.height() - self._grid_height * self._cell_size) // 2
+
+        # Ensure labels have enough space
+        return max(offset_x, label_padding), max(offset_y, label_padding)
+
+    def _cell_rect(self, cell: tuple[int, int]) -> QRect:
+        """Get the area painted for a cell, including its grid lines.
+
+        Args:
+            cell: (row, col) position
+
+        Returns:
+            Widget-space rectangle covering the cell
+        """
+        offset_x, offset_y = self._grid_offset()
+        row, col = cell
+        size = self._cell_size
+        return QRect(offset_x + col * size, offset_y + row * size, size + 1, size + 1)
+
     def _get_cell_at_position(self, pos_x: int, pos_y: int) -> tuple[int, int] | None:
         """Get the cell coordinates at the given position.
 
@@ -289,12 +316,15 @@ class PieceGridWidget(QWidget):
             pos: QPoint position
         """
         cell = self._get_cell_at_position(pos.x(), pos.y())
-        if cell is not None:
-            if self._is_filling:
-                self._filled_cells.add(cell)
-            else:
-                self._filled_cells.discard(cell)
-            self.update()
+        # Dragging revisits cells; only a real change needs work
+        if cell is None or (cell in self._filled_cells) == self._is_filling:
+            return
+        if self._is_filling:
+            self._filled_cells.add(cell)
+        else:
+            self._filled_cells.discard(cell)
+        # Only the toggled cell needs repainting
+        self.update(self._cell_rect(cell))
 
 
 class PieceListItemWidget(QWidget):
@@ -0,0 +1,85 @@
+"""Bitmask helpers for encoding polyomino shapes and board occupancy.
+
+A set of cells is encoded as a single Python int where bit
+``row * stride + col`` is set for every cell in the set. Overlap tests and
+placements then become single integer AND/OR operations.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+
+def shape_to_mask(shape: Iterable[tuple[int, int]], stride: int) -> int:
+    """Encode a set of cells as an integer bitmask.
+
+    Args:
+        shape: (row, col) coordinates with non-negative values
+        stride: Number of bits per row (must exceed the largest column)
+
+    Returns:
+        Integer with bit ``row * stride + col`` set for every cell
+    """
+    mask = 0
+    for row, col in shape:
+        mask |= 1 << (row * stride + col)
+    return mask
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Iterate over the indices of set bits, lowest first.
+
+    Args:
+        mask: Non-negative integer bitmask
+
+    Yields:
+        Index of each set bit
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def mask_to_shape(mask: int, stride: int) -> set[tuple[int, int]]:
+    """Decode an integer bitmask back into a set of cells.
+
+    Args:
+        mask: Non-negative integer bitmask
+        stride: Number of bits per row used when encoding
+
+    Returns:
+        Set of (row, col) coordinates for every set bit
+    """
+    return {divmod(index, stride) for index in iter_bits(mask)}
+
+
+def flood_fill(seed: int, region: int, stride: int) -> int:
+    """Grow a seed mask through 4-directionally adjacent cells of a region.
+
+    Every iteration expands the whole frontier at once with shifts, so the
+    loop runs once per step of the region's diameter rather than once per
+    cell. The region must leave at least one empty column at the end of each
+    row (i.e. ``stride`` greater than the region width) so horizontal shifts
+    cannot wrap into the neighbouring row.
+
+    Args:
+        seed: Mask of starting cells
+        region: Mask of cells the fill may spread through
+        stride: Number of bits per row
+
+    Returns:
+        Mask of all region cells connected to the seed
+    """
+    filled = seed & region
+    while True:
+        grown = (
+            filled
+            | (filled << 1)
+            | (filled >> 1)
+            | (filled << stride)
+            | (filled >> stride)
+        ) & region
+        if grown == filled:
+            return filled
+        filled = grown
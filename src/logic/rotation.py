@@ -2,8 +2,45 @@
 
 from __future__ import annotations
 
+import re
+from functools import cache, lru_cache
 from typing import List, Set, Tuple
 
+from src.logic.bitmask import iter_bits, mask_to_shape, shape_to_mask
+
+# A parenthesised coordinate pair such as "(0, 1)"
+_TUPLE_RE = re.compile(r"\(\s*(-?\d+)\s*,\s*(-?\d+)\s*\)")
+# A whole space-separated token such as "0,1"
+_PAIR_RE = re.compile(r"(-?\d+),(-?\d+)")
+
+# The 8 symmetries of the square (dihedral group D4) as 2x2 matrices
+# ((a, b), (c, d)) mapping (row, col) -> (a*row + b*col, c*row + d*col).
+# The first four are the rotations by 0, 90, 180 and 270 degrees; the last
+# four are the reflections.
+TRANSFORMS: Tuple[Tuple[Tuple[int, int], Tuple[int, int]], ...] = (
+    ((1, 0), (0, 1)),
+    ((0, 1), (-1, 0)),
+    ((-1, 0), (0, -1)),
+    ((0, -1), (1, 0)),
+    ((1, 0), (0, -1)),
+    ((-1, 0), (0, 1)),
+    ((0, 1), (1, 0)),
+    ((0, -1), (-1, 0)),
+)
+
+# Rotation transforms by rotate_shape angle (0 degrees is handled separately)
+_ROTATION_TRANSFORMS = {
+    90: TRANSFORMS[1],
+    180: TRANSFORMS[2],
+    270: TRANSFORMS[3],
+}
+
+# Mirror transforms by flip_shape axis name
+_FLIP_TRANSFORMS = {
+    "horizontal": TRANSFORMS[4],
+    "vertical": TRANSFORMS[5],
+}
+
 
 def rotate_shape(
     shape: Set[Tuple[int, int]], degrees: int = 90
@@ -24,20 +61,11 @@ def rotate_shape(
         raise ValueError("Rotation must be a multiple of 90 degrees")
 
     # Normalize to 0-360
-    degrees = degrees % 360
-
+    degrees %= 360
     if degrees == 0:
         return shape.copy()
 
-    if degrees == 90:
-        new_shape = {(col, -row) for row, col in shape}
-    elif degrees == 180:
-        new_shape = {(-row, -col) for row, col in shape}
-    else:  # degrees == 270
-        new_shape = {(-col, row) for row, col in shape}
-
-    # Normalize to origin
-    return _normalize_shape(new_shape)
+    return _transform_shape(shape, _ROTATION_TRANSFORMS[degrees])
 
 
 def flip_shape(
@@ -55,16 +83,11 @@ def flip_shape(
     Raises:
         ValueError: If axis is not 'horizontal' or 'vertical'
     """
-    if axis not in ("horizontal", "vertical"):
+    transform = _FLIP_TRANSFORMS.get(axis)
+    if transform is None:
         raise ValueError("Axis must be 'horizontal' or 'vertical'")
 
-    if axis == "horizontal":
-        new_shape = {(row, -col) for row, col in shape}
-    else:
-        new_shape = {(-row, col) for row, col in shape}
-
-    # Normalize to origin
-    return _normalize_shape(new_shape)
+    return _transform_shape(shape, transform)
 
 
 def get_all_orientations(
@@ -78,47 +101,159 @@ def get_all_orientations(
         shape: Set of (row, col) coordinates
 
     Returns:
-        List of unique shape orientations
+        List of unique shape orientations, starting with a copy of the input
+        shape; the others are normalized to the origin
+    """
+    orbit = orientation_orbit(frozenset(shape))
+    return [set(shape), *(set(oriented) for oriented in orbit[1:])]
+
+
+def orientation_orbit(
+    shape: frozenset[Tuple[int, int]],
+) -> Tuple[frozenset[Tuple[int, int]], ...]:
+    """Get the unique orientations of a shape as an immutable, shared tuple.
+
+    Results are cached per normalized shape, so pieces that share a shape
+    (or are translations of one another) reuse the same orbit.
+
+    Args:
+        shape: Frozenset of (row, col) coordinates
+
+    Returns:
+        Tuple of unique normalized orientations, identity first
     """
-    orientations: List[Set[Tuple[int, int]]] = []
-    seen_shapes: Set[frozenset[Tuple[int, int]]] = set()
+    return _orientation_orbit(frozenset(_normalize_shape(set(shape))))
+
 
-    for flip_axis in [None, "horizontal", "vertical"]:
-        if flip_axis is None:
-            base_shape = shape
-        else:
-            base_shape = flip_shape(shape, flip_axis)
+@cache
+def _orientation_orbit(
+    shape: frozenset[Tuple[int, int]],
+) -> Tuple[frozenset[Tuple[int, int]], ...]:
+    """Decode the unique orientations of a normalized shape (cached)."""
+    masks, _ = _orientation_masks(shape)
+    return tuple(frozenset(mask_to_shape(mask, width)) for mask, width, _ in masks)
 
-        for degrees in [0, 90, 180, 270]:
-            oriented = rotate_shape(base_shape, degrees)
-            shape_key = frozenset(_normalize_shape(oriented))
-            if shape_key not in seen_shapes:
-                seen_shapes.add(shape_key)
-                orientations.append(oriented)
 
-    return orientations
+def orientation_masks(
+    shape: frozenset[Tuple[int, int]],
+) -> Tuple[Tuple[int, int, int], ...]:
+    """Get the unique orientations of a shape as packed bitmasks.
+
+    Entries line up with orientation_orbit, so callers that need both the
+    cells and the masks can zip the two without re-encoding anything.
+
+    Args:
+        shape: Frozenset of (row, col) coordinates
+
+    Returns:
+        Tuple of (mask, width, height) per unique orientation, identity first;
+        each mask uses its orientation's width as the row stride
+    """
+    masks, _ = _orientation_masks(frozenset(_normalize_shape(set(shape))))
+    return masks
+
+
+@cache
+def _orientation_masks(
+    shape: frozenset[Tuple[int, int]],
+) -> Tuple[Tuple[Tuple[int, int, int], ...], int]:
+    """Compute the unique orientation masks of a normalized shape (cached).
+
+    The shape is packed into a bitmask over its bounding box once; each
+    transform then only moves bits, and duplicates are skipped by mask as
+    they are generated.
+
+    Returns:
+        Tuple of (masks, rotation_count); the first rotation_count masks are
+        the unique pure rotations, since TRANSFORMS lists rotations first
+    """
+    if not shape:
+        return ((0, 0, 0),), 1
+
+    height = max(row for row, _ in shape) + 1
+    width = max(col for _, col in shape) + 1
+    mask = shape_to_mask(shape, width)
+
+    orientations: List[Tuple[int, int, int]] = []
+    seen_masks: Set[Tuple[int, int]] = set()
+    rotation_count = 0
+
+    for index, transform in enumerate(TRANSFORMS):
+        if index == 4:
+            rotation_count = len(orientations)
+        new_width, permutation = transform_permutation(height, width, transform)
+        oriented = 0
+        for bit in iter_bits(mask):
+            oriented |= 1 << permutation[bit]
+        # Masks are only comparable at the same row stride
+        key = (new_width, oriented)
+        if key in seen_masks:
+            continue
+        seen_masks.add(key)
+        # Transforms with a zero in the top-left swap rows and columns
+        new_height = width if transform[0][0] == 0 else height
+        orientations.append((oriented, new_width, new_height))
+
+    return tuple(orientations), rotation_count
+
+
+@lru_cache(maxsize=256)
+def transform_permutation(
+    height: int,
+    width: int,
+    transform: Tuple[Tuple[int, int], Tuple[int, int]],
+) -> Tuple[int, Tuple[int, ...]]:
+    """Map each bit of a height x width box to its place after a transform.
+
+    Bit ``row * width + col`` of the source box moves to bit
+    ``new_row * new_width + new_col`` of the transformed box, which is
+    normalized back to the origin. Tables depend only on the box size, so
+    they are cached and shared by every shape with the same bounding box.
+
+    Args:
+        height: Number of rows in the source box
+        width: Number of columns in the source box
+        transform: D4 matrix from TRANSFORMS
+
+    Returns:
+        Tuple of (new_width, permutation) where permutation[i] is the
+        destination bit of source bit i
+    """
+    (a, b), (c, d) = transform
+    # Transformed corners of the box give the offset back to the origin
+    corners = [
+        (a * row + b * col, c * row + d * col)
+        for row in (0, height - 1)
+        for col in (0, width - 1)
+    ]
+    row_shift = min(row for row, _ in corners)
+    col_shift = min(col for _, col in corners)
+    new_width = max(col for _, col in corners) - col_shift + 1
+
+    permutation = tuple(
+        (a * row + b * col - row_shift) * new_width + (c * row + d * col - col_shift)
+        for row in range(height)
+        for col in range(width)
+    )
+    return new_width, permutation
 
 
 def get_unique_rotations(shape: Set[Tuple[int, int]]) -> List[Set[Tuple[int, int]]]:
     """Generate unique rotations of a shape (no flips).
 
+    Rotations lead the cached orientation orbit, so this is a slice of it.
+
     Args:
         shape: Set of (row, col) coordinates
 
     Returns:
-        List of unique rotations
+        List of unique rotations, starting with a copy of the input shape; the
+        others are normalized to the origin
     """
-    rotations: List[Set[Tuple[int, int]]] = []
-    seen_shapes: Set[frozenset[Tuple[int, int]]] = set()
-
-    for degrees in [0, 90, 180, 270]:
-        rotated = rotate_shape(shape, degrees)
-        shape_key = frozenset(_normalize_shape(rotated))
-        if shape_key not in seen_shapes:
-            seen_shapes.add(shape_key)
-            rotations.append(rotated)
-
-    return rotations
+    normalized = frozenset(_normalize_shape(set(shape)))
+    _, rotation_count = _orientation_masks(normalized)
+    rotations = _orientation_orbit(normalized)[1:rotation_count]
+    return [set(shape), *(set(rotated) for rotated in rotations)]
 
 
 def _normalize_shape(shape: Set[Tuple[int, int]]) -> Set[Tuple[int, int]]:
@@ -133,11 +268,68 @@ def _normalize_shape(shape: Set[Tuple[int, int]]) -> Set[Tuple[int, int]]:
     if not shape:
         return set()
 
-    min_row = min(row for row, _ in shape)
-    min_col = min(col for _, col in shape)
+    # Track both minima in a single pass over the cells
+    cells = iter(shape)
+    min_row, min_col = next(cells)
+    for row, col in cells:
+        if row < min_row:
+            min_row = row
+        if col < min_col:
+            min_col = col
     return {(row - min_row, col - min_col) for row, col in shape}
 
 
+def _transform_shape(
+    shape: Set[Tuple[int, int]],
+    transform: Tuple[Tuple[int, int], Tuple[int, int]],
+) -> Set[Tuple[int, int]]:
+    """Apply a D4 transform and normalize the result to the origin in one pass.
+
+    Args:
+        shape: Set of (row, col) coordinates
+        transform: D4 matrix from TRANSFORMS
+
+    Returns:
+        Transformed shape coordinates with min row/col = 0
+    """
+    if not shape:
+        return set()
+
+    (a, b), (c, d) = transform
+    min_row, max_row, min_col, max_col = _bounds(shape)
+    # Each output coordinate is linear in row and col, so its minimum over
+    # the shape is reached at the input's bounds
+    row_shift = min(a * min_row, a * max_row) + min(b * min_col, b * max_col)
+    col_shift = min(c * min_row, c * max_row) + min(d * min_col, d * max_col)
+    return {
+        (a * row + b * col - row_shift, c * row + d * col - col_shift)
+        for row, col in shape
+    }
+
+
+def _bounds(shape: Set[Tuple[int, int]]) -> Tuple[int, int, int, int]:
+    """Get the bounds of a non-empty shape in a single pass.
+
+    Args:
+        shape: Non-empty set of (row, col) coordinates
+
+    Returns:
+        Tuple of (min_row, max_row, min_col, max_col)
+    """
+    cells = iter(shape)
+    min_row, min_col = max_row, max_col = next(cells)
+    for row, col in cells:
+        if row < min_row:
+            min_row = row
+        elif row > max_row:
+            max_row = row
+        if col < min_col:
+            min_col = col
+        elif col > max_col:
+            max_col = col
+    return min_row, max_row, min_col, max_col
+
+
 def shape_to_string(shape: Set[Tuple[int, int]]) -> str:
     """Convert shape to string representation for debugging.
 
@@ -157,46 +349,16 @@ def shape_from_string(shape_str: str) -> Set[Tuple[int, int]]:
         shape_str: String like "{(0,0), (0,1), (1,1)}" or "0,0 0,1 1,1"
 
     Returns:
-        Set of (row, col) coordinates
-
-    Raises:
-        ValueError: If format is invalid
+        Set of (row, col) coordinates (empty if no coordinates are found)
     """
-    import re
-
     cleaned = shape_str.strip()
     if cleaned.startswith("{") and cleaned.endswith("}"):
         cleaned = cleaned[1:-1]
 
-    if not cleaned.strip():
-        return set()
-
-    # Use regex to find all coordinate pairs like (0,1)
-    coord_pattern = r"\(\s*(-?\d+)\s*,\s*(-?\d+)\s*\)"
-    matches = re.findall(coord_pattern, cleaned)
-
-    if not matches and "(" not in cleaned:
-        # Try space-separated format: "0,0 0,1 1,1"
-        parts = cleaned.split()
-        shape: Set[Tuple[int, int]] = set()
-        for part in parts:
-            coords = part.split(",")
-            if len(coords) == 2:
-                try:
-                    row = int(coords[0].strip())
-                    col = int(coords[1].strip())
-                    shape.add((row, col))
-                except ValueError:
-                    pass
-        return shape
-
-    shape: Set[Tuple[int, int]] = set()
-    for match in matches:
-        try:
-            row = int(match[0])
-            col = int(match[1])
-            shape.add((row, col))
-        except ValueError:
-            raise ValueError(f"Invalid coordinate: ({match[0]}, {match[1]})")
-
-    return shape
+    if "(" in cleaned:
+        pairs = _TUPLE_RE.findall(cleaned)
+    else:
+        # Each token must be exactly one pair; anything else is skipped
+        matches = (_PAIR_RE.fullmatch(token) for token in cleaned.split())
+        pairs = [match.groups() for match in matches if match is not None]
+    return {(int(row), int(col)) for row, col in pairs}
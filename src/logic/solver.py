@@ -8,15 +8,59 @@ clean separation from GUI code.
 from __future__ import annotations
 
 from collections.abc import Generator
+from itertools import islice
 from typing import Any
 
+from src.logic.bitmask import iter_bits
 from src.models.board import GameBoard
 from src.models.piece import PuzzlePiece
 
+# A precomputed placement: (piece type index, oriented cells, origin,
+# covered-cell bitmask)
+_Placement = tuple[int, frozenset[tuple[int, int]], tuple[int, int], int]
+
+# Most dead-end states remembered at once; a few hundred bytes each, so the
+# memo stays in the tens of megabytes however long a search runs
+MAX_FAILED_STATES = 100_000
+
+
+class _FailedStates:
+    """Set of dead-end search states with a bounded size.
+
+    When full, the set is cleared rather than grown. Forgetting a state only
+    means it may be searched again, so the bound never affects correctness.
+    """
+
+    __slots__ = ("_states", "_limit")
+
+    def __init__(self, limit: int) -> None:
+        """Initialize an empty memo.
+
+        Args:
+            limit: Maximum number of states held at once
+        """
+        self._states: set[tuple[int, tuple[int, ...]]] = set()
+        self._limit = limit
+
+    def add(self, state: tuple[int, tuple[int, ...]]) -> None:
+        """Remember a dead-end state, clearing the memo first if it is full."""
+        if len(self._states) >= self._limit:
+            self._states.clear()
+        self._states.add(state)
+
+    def __contains__(self, state: object) -> bool:
+        """Check whether a state is known to be a dead end."""
+        return state in self._states
+
+    def __len__(self) -> int:
+        """Get the number of states currently remembered."""
+        return len(self._states)
+
 
 def solve_backtracking(
     pieces: dict[PuzzlePiece, int],
     board: GameBoard,
+    yield_steps: bool = True,
 ) -> Generator[dict[str, Any], None, None]:
     """Generator function that solves polyomino puzzles using backtracking.
 
@@ -28,6 +72,9 @@ def solve_backtracking(
         pieces: Dictionary mapping unique puzzle pieces to their counts
                 (e.g., {L_tromino: 3, I_tromino: 2})
         board: The game board to solve
+        yield_steps: If False, skip the per-step 'place'/'remove' events and
+            only yield the final 'solved' or 'no_solution' event (useful when
+            nothing is visualizing the search)
 
     Yields:
         Dictionary containing:
@@ -51,6 +98,21 @@ def solve_backtracking(
     # Get all unique piece types sorted by area (largest first)
     piece_types = sorted(remaining.keys(), key=lambda p: p.area, reverse=True)
 
+    # Precompute, for every cell, the placements covering it, ordered by piece
+    # type as searched; each is tested with a single AND against the
+    # occupancy. Cells occupied before the search starts stay occupied, so
+    # only the positions valid on the starting board are kept.
+    cell_count = board.width * board.height
+    placements_by_cell: list[list[_Placement]] = [[] for _ in range(cell_count)]
+    for piece_index, piece in enumerate(piece_types):
+        for orientation in piece.orientation_table:
+            shape = orientation.cells
+            for origin, mask in board.valid_placements(shape):
+                placement = (piece_index, shape, origin, mask)
+                for index in iter_bits(mask):
+                    placements_by_cell[index].append(placement)
+    full_mask = (1 << cell_count) - 1
+
     # Check if already solved (no pieces to place)
     if not remaining:
         yield {
@@ -62,26 +124,70 @@ def solve_backtracking(
         }
         return
 
-    def find_next_empty() -> tuple[int, int] | None:
-        """Find first empty cell in L→R, T→B order."""
-        for row in range(board.height):
-            for col in range(board.width):
-                if board.get_piece_at((row, col)) is None:
-                    return (row, col)
-        return None
+    # Depth-first search on an explicit stack instead of recursive generators,
+    # so resuming after a yield does not walk a chain of suspended frames.
+    # Each frame is [candidates for the cell being filled, next index to try,
+    # state key]; every frame above the root was pushed right after a
+    # placement, which is undone when that frame runs out of candidates.
+    #
+    # The cell to fill is fixed by the occupancy and remaining counts, so
+    # those fully describe a state. States whose candidates were exhausted
+    # are remembered (up to MAX_FAILED_STATES at a time) and not searched
+    # again when a different placement order reaches them.
+    #
+    # The hot loop works on counts indexed by piece type, mirrored into the
+    # yielded remaining dict, so it never hashes a PuzzlePiece; bound methods
+    # are looked up once.
+    counts = [remaining[piece] for piece in piece_types]
+    failed_states = _FailedStates(MAX_FAILED_STATES)
+    place_shape = board.place_shape
+    remove_shape = board.remove_shape
+    occupied = board.occupied_mask
+    key = (occupied, tuple(counts))
+    free = full_mask & ~occupied
+    candidates: Any = ()
+    if free:
+        cell_index = _most_constrained_cell(placements_by_cell, occupied, free, counts)
+        candidates = placements_by_cell[cell_index]
+    # Frames are [candidates, next index, state key, piece type index of the
+    # placement that led here]
+    stack: list[list[Any]] = [[candidates, 0, key, -1]]
+    push = stack.append
+    while stack:
+        frame = stack[-1]
+        candidates, index, _, _ = frame
+        occupied = board.occupied_mask
+        descended = False
+        for piece_index, shape, origin, mask in islice(candidates, index, None):
+            index += 1
+            if occupied & mask:
+                continue
+            count = counts[piece_index]
+            if count <= 0:
+                continue
 
-    def backtrack() -> Generator[dict[str, Any], None, bool]:
-        """Recursive backtracking generator.
+            piece = piece_types[piece_index]
+            place_shape(shape, origin)
+            placed.append((shape, origin, piece))
+            counts[piece_index] = count - 1
+            if count == 1:
+                del remaining[piece]
+            else:
+                remaining[piece] = count - 1
 
-        Yields state dictionaries and returns True if solution found.
-        """
-        nonlocal step_count
+            step_count += 1
+            if yield_steps:
+                yield {
+                    "type": "place",
+                    "board_snapshot": board,
+                    "placed_pieces": placed,
+                    "remaining_pieces": remaining,
+                    "step_count": step_count,
+                }
 
-        # Find next empty cell
-        cell = find_next_empty()
-        if cell is None:
-            # Board is full - check if solved
-            if not remaining:
+            occupied = board.occupied_mask
+            free = full_mask & ~occupied
+            if not free and not remaining:
                 step_count += 1
                 yield {
                     "type": "solved",
@@ -90,64 +196,88 @@ def solve_backtracking(
                     "remaining_pieces": remaining,
                     "step_count": step_count,
                 }
-                return True
-            # No empty cells but pieces remain
-            return False
+                return
 
-        # Try each piece type
-        for piece in piece_types:
-            count = remaining.get(piece, 0)
-            if count <= 0:
-                continue
+            # A known dead end, or a full board with pieces left, gets no
+            # candidates, so the placement is undone straight away
+            frame[1] = index
+            key = (occupied, tuple(counts))
+            if not free or key in failed_states:
+                push([(), 0, key, piece_index])
+            else:
+                cell_index = _most_constrained_cell(
+                    placements_by_cell, occupied, free, counts
+                )
+                push([placements_by_cell[cell_index], 0, key, piece_index])
+            descended = True
+            break
 
-            # Try each orientation
-            for orientation in piece.orientations:
-                top_left_cell = min(orientation, key=lambda c: (c[0], c[1]))
-                origin = (cell[0] - top_left_cell[0], cell[1] - top_left_cell[1])
-
-                if board.can_place_shape(orientation, origin):
-                    board.place_shape(orientation, origin)
-                    placed.append((orientation, origin, piece))
-                    remaining[piece] = count - 1
-                    if remaining[piece] == 0:
-                        del remaining[piece]
-
-                    step_count += 1
-                    yield {
-                        "type": "place",
-                        "board_snapshot": board,
-                        "placed_pieces": placed,
-                        "remaining_pieces": remaining,
-                        "step_count": step_count,
-                    }
-
-                    # Recurse
-                    if (yield from backtrack()):
-                        return True
-
-                    # Backtrack
-                    shape, pos, p = placed.pop()
-                    board.remove_shape(shape, pos)
-                    remaining[p] = remaining.get(p, 0) + 1
-                    step_count += 1
-                    yield {
-                        "type": "remove",
-                        "board_snapshot": board,
-                        "placed_pieces": placed,
-                        "remaining_pieces": remaining,
-                        "step_count": step_count,
-                    }
-
-        # No piece fits at this cell
-        return False
-
-    # Start backtracking
-    if not (yield from backtrack()):
-        # No solution found
-        yield {
-            "type": "no_solution",
-            "board_snapshot": board,
-            "placed_pieces": placed,
-            "remaining_pieces": remaining,
-            "step_count": step_count,
-        }
+        if descended:
+            continue
+
+        # No piece fits at this cell: backtrack the placement that led here
+        _, _, key, piece_index = stack.pop()
+        failed_states.add(key)
+        if stack:
+            shape, pos, p = placed.pop()
+            remove_shape(shape, pos)
+            counts[piece_index] += 1
+            remaining[p] = counts[piece_index]
+            step_count += 1
+            if yield_steps:
+                yield {
+                    "type": "remove",
+                    "board_snapshot": board,
+                    "placed_pieces": placed,
+                    "remaining_pieces": remaining,
+                    "step_count": step_count,
+                }
+
+    # No solution found
+    yield {
+        "type": "no_solution",
+        "board_snapshot": board,
+        "placed_pieces": placed,
+        "remaining_pieces": remaining,
+        "step_count": step_count,
+    }
+
+
+def _most_constrained_cell(
+    placements_by_cell: list[list[_Placement]],
+    occupied: int,
+    free: int,
+    counts: list[int],
+) -> int:
+    """Pick the free cell with the fewest placements that still fit (MRV).
+
+    Every free cell must be covered by some placement, so branching on the
+    most constrained one keeps the search tree narrow, and a cell with no
+    fitting placement ends the branch at once. Ties go to the first cell in
+    L→R, T→B order.
+
+    Args:
+        placements_by_cell: Placements covering each cell, by cell index
+        occupied: Occupancy bitmask of the board
+        free: Non-empty bitmask of the free cells
+        counts: Counts left to place, by piece type index
+
+    Returns:
+        Index (row * width + col) of the chosen cell
+    """
+    best_index = -1
+    best_count = 0
+    for index in iter_bits(free):
+        count = 0
+        for piece_index, _, _, mask in placements_by_cell[index]:
+            if not occupied & mask and counts[piece_index] > 0:
+                count += 1
+                # Counting further cannot make this cell the best one
+                if best_index >= 0 and count >= best_count:
+                    break
+        else:
+            # A dead end cannot be beaten, and it fails the branch at once
+            if not count:
+                return index
+            best_index, best_count = index, count
+    return best_index
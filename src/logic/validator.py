@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import List, Set, Tuple
 
+from src.logic.bitmask import flood_fill, mask_to_shape, shape_to_mask
+
 
 class ValidationError:
     """Represents a validation error.
@@ -14,6 +16,8 @@ class ValidationError:
         context: Additional context (piece_id, position, etc.)
     """
 
+    __slots__ = ("error_type", "message", "context")
+
     def __init__(
         self,
         error_type: str,
@@ -84,6 +88,40 @@ def validate_piece_shape(shape: Set[Tuple[int, int]]) -> List[ValidationError]:
     return errors
 
 
+def placement_ok(
+    piece_shape: Set[Tuple[int, int]],
+    board_width: int,
+    board_height: int,
+    position: Tuple[int, int],
+    occupied_cells: Set[Tuple[int, int]] | None = None,
+) -> bool:
+    """Check whether a piece can be placed, stopping at the first bad cell.
+
+    Boolean fast path for validate_piece_placement that builds no error
+    objects; use it when only the verdict matters.
+
+    Args:
+        piece_shape: Set of (row, col) coordinates for the piece
+        board_width: Board width in cells
+        board_height: Board height in cells
+        position: (row, col) position to place piece origin
+        occupied_cells: Set of already occupied cell positions
+
+    Returns:
+        True if every cell is on the board and unoccupied
+    """
+    origin_row, origin_col = position
+    occupied = occupied_cells or ()
+    for row_offset, col_offset in piece_shape:
+        row = origin_row + row_offset
+        col = origin_col + col_offset
+        if not (0 <= row < board_height and 0 <= col < board_width):
+            return False
+        if (row, col) in occupied:
+            return False
+    return True
+
+
 def validate_piece_placement(
     piece_shape: Set[Tuple[int, int]],
     board_width: int,
@@ -103,6 +141,10 @@ def validate_piece_placement(
     Returns:
         List of validation errors (empty if placement is valid)
     """
+    # Valid placements need no per-cell error reporting
+    if placement_ok(piece_shape, board_width, board_height, position, occupied_cells):
+        return []
+
     errors: List[ValidationError] = []
     occupied = occupied_cells or set()
 
@@ -186,7 +228,7 @@ def validate_puzzle_config(
         return errors
 
     # Check unique piece shapes
-    piece_shapes = []
+    seen_shapes: Set[frozenset[Tuple[int, int]]] = set()
     for piece in pieces:
         if not hasattr(piece, "canonical_shape"):
             errors.append(
@@ -198,7 +240,7 @@ def validate_puzzle_config(
             continue
 
         shape = piece.canonical_shape
-        if shape in piece_shapes:
+        if shape in seen_shapes:
             errors.append(
                 ValidationError(
                     "DUPLICATE_PIECE_SHAPE",
@@ -206,7 +248,7 @@ def validate_puzzle_config(
                     {"shape": str(piece.canonical_shape)},
                 )
             )
-        piece_shapes.append(shape)
+        seen_shapes.add(shape)
 
     # Validate each piece shape
     total_piece_area = 0
@@ -242,46 +284,38 @@ def validate_puzzle_config(
     return errors
 
 
-def is_contiguous(shape: Set[Tuple[int, int]]) -> bool:
-    """Check if all cells in shape are 4-directionally connected.
+def _rasterize(shape: Set[Tuple[int, int]]) -> Tuple[int, int, int, int] | None:
+    """Encode a shape as a bitmask padded with one empty column per row.
+
+    A connected shape of n cells spans at most n - 1 rows plus columns, so a
+    wider bounding box is rejected before a mask of its area is built.
 
     Args:
-        shape: Set of (row, col) coordinates
+        shape: Non-empty set of (row, col) coordinates
 
     Returns:
-        True if shape is contiguous, False otherwise
+        Tuple of (mask, stride, min_row, min_col), or None if the shape's
+        bounding box is too spread out for its cells to be connected
     """
-    if not shape:
-        return True
+    rows = [row for row, _ in shape]
+    cols = [col for _, col in shape]
+    min_row = min(rows)
+    min_col = min(cols)
+    max_col = max(cols)
+    if (max(rows) - min_row) + (max_col - min_col) >= len(shape):
+        return None
 
-    visited: Set[Tuple[int, int]] = set()
-    stack: List[Tuple[int, int]] = [next(iter(shape))]
-
-    while stack:
-        current = stack.pop()
-        if current in visited:
-            continue
-        visited.add(current)
-
-        row, col = current
-        neighbors = [
-            (row - 1, col),  # Up
-            (row + 1, col),  # Down
-            (row, col - 1),  # Left
-            (row, col + 1),  # Right
-        ]
-
-        for neighbor in neighbors:
-            if neighbor in shape and neighbor not in visited:
-                stack.append(neighbor)
+    stride = max_col - min_col + 2
+    mask = shape_to_mask(((row - min_row, col - min_col) for row, col in shape), stride)
+    return mask, stride, min_row, min_col
 
-    return len(visited) == len(shape)
 
-
-def find_connected_components(
+def _sparse_components(
     shape: Set[Tuple[int, int]],
 ) -> List[Set[Tuple[int, int]]]:
-    """Find all connected components in a shape.
+    """Find connected components by searching the cell set directly.
+
+    Used for shapes whose bounding box is too large to rasterize.
 
     Args:
         shape: Set of (row, col) coordinates
@@ -289,9 +323,6 @@ def find_connected_components(
     Returns:
         List of connected component sets
     """
-    if not shape:
-        return []
-
     visited: Set[Tuple[int, int]] = set()
     components: List[Set[Tuple[int, int]]] = []
 
@@ -299,29 +330,77 @@ def find_connected_components(
         if cell in visited:
             continue
 
-        # Start a new component
         component: Set[Tuple[int, int]] = set()
         stack: List[Tuple[int, int]] = [cell]
-
+        visited.add(cell)
         while stack:
-            current = stack.pop()
-            if current in visited:
-                continue
-            visited.add(current)
-            component.add(current)
-
-            row, col = current
-            neighbors = [
+            row, col = stack.pop()
+            component.add((row, col))
+            for neighbor in (
                 (row - 1, col),
                 (row + 1, col),
                 (row, col - 1),
                 (row, col + 1),
-            ]
-
-            for neighbor in neighbors:
+            ):
                 if neighbor in shape and neighbor not in visited:
+                    visited.add(neighbor)
                     stack.append(neighbor)
 
         components.append(component)
 
     return components
+
+
+def is_contiguous(shape: Set[Tuple[int, int]]) -> bool:
+    """Check if all cells in shape are 4-directionally connected.
+
+    Args:
+        shape: Set of (row, col) coordinates
+
+    Returns:
+        True if shape is contiguous, False otherwise
+    """
+    if not shape:
+        return True
+
+    raster = _rasterize(shape)
+    if raster is None:
+        return False
+
+    region, stride, _, _ = raster
+    return flood_fill(region & -region, region, stride) == region
+
+
+def find_connected_components(
+    shape: Set[Tuple[int, int]],
+) -> List[Set[Tuple[int, int]]]:
+    """Find all connected components in a shape.
+
+    Args:
+        shape: Set of (row, col) coordinates
+
+    Returns:
+        List of connected component sets
+    """
+    if not shape:
+        return []
+
+    raster = _rasterize(shape)
+    if raster is None:
+        return _sparse_components(shape)
+
+    remaining, stride, min_row, min_col = raster
+    components: List[Set[Tuple[int, int]]] = []
+
+    while remaining:
+        # Start a new component from the lowest remaining cell
+        component = flood_fill(remaining & -remaining, remaining, stride)
+        remaining ^= component
+        components.append(
+            {
+                (row + min_row, col + min_col)
+                for row, col in mask_to_shape(component, stride)
+            }
+        )
+
+    return components
@@ -2,6 +2,32 @@
 
 from __future__ import annotations
 
+import copy
+from typing import NamedTuple
+
+from src.logic.bitmask import mask_to_shape, shape_to_mask
+
+# Cell marker for blocked (initially filled) cells, as returned by get_piece_at
+BLOCKED_CELL = -1
+
+
+class _ShapeLayout(NamedTuple):
+    """Placement data for a shape, specialized to one board's dimensions.
+
+    Both the mask and the offsets are relative to the cell at the top-left
+    corner of the shape's bounding box. The origin bounds give the range of
+    positions at which the whole shape stays on the board, and shift is the
+    flat index of the bounding-box corner relative to the origin.
+    """
+
+    mask: int
+    offsets: tuple[int, ...]
+    first_row: int
+    last_row: int
+    first_col: int
+    last_col: int
+    shift: int
+
 
 class GameBoard:
     """Represents the rectangular grid area where pieces must be placed.
@@ -9,10 +35,29 @@ class GameBoard:
     Attributes:
         width: Number of columns in the board
         height: Number of rows in the board
-        cells: 2D array (list of lists) where cells[row][col] = piece_id, None, or -1
+        cells: Flat list where cells[row * width + col] = piece_id, None, or
+            BLOCKED_CELL
         blocked_cells: Set of initially filled (blocked) cell positions
+
+    Occupancy is also tracked as an integer bitmask (bit ``row * width + col``)
+    so that placement checks reduce to a single AND against the shape mask.
     """
 
+    __slots__ = (
+        "_width",
+        "_height",
+        "_cells",
+        "_full_mask",
+        "_shape_layouts",
+        "_blocked_cells",
+        "_blocked_mask",
+        "_occupied_mask",
+        "_filled_count",
+        "_blank_cells",
+        "_occupied_cache",
+        "_empty_cache",
+    )
+
     def __init__(
         self,
         width: int,
@@ -37,12 +82,16 @@ class GameBoard:
 
         self._width = width
         self._height = height
-        self._cells: list[list[int | None]] = [
-            [None for _ in range(width)] for _ in range(height)
-        ]
+        # Row-major flat storage: cell (row, col) lives at index row * width + col
+        self._cells: list[int | None] = [None] * (width * height)
+
+        self._full_mask = (1 << (width * height)) - 1
+        # Per-shape placement data computed once for this board's row stride
+        self._shape_layouts: dict[frozenset[tuple[int, int]], _ShapeLayout] = {}
 
         # Validate and set blocked cells
         self._blocked_cells: set[tuple[int, int]] = set()
+        self._blocked_mask = 0
         if blocked_cells:
             for cell in blocked_cells:
                 row, col = cell
@@ -51,8 +100,18 @@ class GameBoard:
                         f"Blocked cell {cell} is out of board bounds ({width}x{height})"
                     )
                 self._blocked_cells.add(cell)
-                # Mark blocked cells as occupied (use -1 as special marker)
-                self._cells[row][col] = -1
+                self._blocked_mask |= 1 << (row * width + col)
+                # Mark blocked cells as occupied
+                self._cells[row * width + col] = BLOCKED_CELL
+
+        # Blocked cells count as occupied for placement purposes
+        self._occupied_mask = self._blocked_mask
+        self._filled_count = len(self._blocked_cells)
+        # Pristine cell contents (blocked markers only), restored by clear()
+        self._blank_cells = tuple(self._cells)
+        # Decoded cell sets, each tagged with the occupancy mask it was built from
+        self._occupied_cache: tuple[int, frozenset[tuple[int, int]]] | None = None
+        self._empty_cache: tuple[int, frozenset[tuple[int, int]]] | None = None
 
     @property
     def width(self) -> int:
@@ -82,12 +141,101 @@ class GameBoard:
     @property
     def filled_area(self) -> int:
         """Get number of occupied cells."""
-        return sum(1 for row in self._cells for cell in row if cell is not None)
+        return self._filled_count
 
     @property
     def empty_area(self) -> int:
         """Get number of empty cells."""
-        return sum(1 for row in self._cells for cell in row if cell is None)
+        return self._width * self._height - self._filled_count
+
+    @property
+    def blocked_mask(self) -> int:
+        """Get the blocked cells as a bitmask (bit row * width + col)."""
+        return self._blocked_mask
+
+    @property
+    def occupied_mask(self) -> int:
+        """Get the occupied cells, blocked included, as a bitmask."""
+        return self._occupied_mask
+
+    def _shape_layout(self, shape: frozenset[tuple[int, int]]) -> _ShapeLayout:
+        """Get the cached placement layout of a shape for this board.
+
+        Args:
+            shape: The shape cells as a frozenset of (row_offset, col_offset) tuples
+
+        Returns:
+            Layout with the shape's bitmask and flat cell offsets
+        """
+        layout = self._shape_layouts.get(shape)
+        if layout is None:
+            if shape:
+                min_row = min(row for row, _ in shape)
+                min_col = min(col for _, col in shape)
+                max_row = max(row for row, _ in shape)
+                max_col = max(col for _, col in shape)
+            else:
+                min_row = min_col = 0
+                max_row = max_col = -1
+            offsets = tuple(
+                (row - min_row) * self._width + (col - min_col) for row, col in shape
+            )
+            mask = shape_to_mask(
+                ((row - min_row, col - min_col) for row, col in shape), self._width
+            )
+            layout = _ShapeLayout(
+                mask,
+                offsets,
+                -min_row,
+                self._height - 1 - max_row,
+                -min_col,
+                self._width - 1 - max_col,
+                min_row * self._width + min_col,
+            )
+            self._shape_layouts[shape] = layout
+        return layout
+
+    def _locate(
+        self, shape: frozenset[tuple[int, int]], position: tuple[int, int]
+    ) -> tuple[_ShapeLayout, int] | None:
+        """Find where a shape placed at a position lands on the board.
+
+        Args:
+            shape: The shape cells as a frozenset of (row_offset, col_offset) tuples
+            position: (row, col) position to place shape origin
+
+        Returns:
+            Tuple of (layout, anchor index), or None if the shape leaves the board
+        """
+        layout = self._shape_layout(shape)
+        row, col = position
+        if not (
+            layout.first_row <= row <= layout.last_row
+            and layout.first_col <= col <= layout.last_col
+        ):
+            return None
+        return layout, row * self._width + col + layout.shift
+
+    def placement_mask(
+        self, shape: frozenset[tuple[int, int]], position: tuple[int, int]
+    ) -> int | None:
+        """Get the cells a shape would cover as a bitmask, ignoring occupancy.
+
+        A placement is free exactly when this mask shares no bits with
+        occupied_mask.
+
+        Args:
+            shape: The shape cells as a frozenset of (row_offset, col_offset) tuples
+            position: (row, col) position to place shape origin
+
+        Returns:
+            Bitmask of covered cells, or None if the shape leaves the board
+        """
+        located = self._locate(shape, position)
+        if located is None:
+            return None
+        layout, anchor = located
+        return layout.mask << anchor
 
     def can_place_shape(
         self, shape: frozenset[tuple[int, int]], position: tuple[int, int]
@@ -101,24 +249,54 @@ class GameBoard:
         Returns:
             True if shape fits without overlapping, going out of bounds, or hitting blocked cells
         """
-        for row_offset, col_offset in shape:
-            row = position[0] + row_offset
-            col = position[1] + col_offset
+        located = self._locate(shape, position)
+        if located is None:
+            return False
+        layout, anchor = located
+        # Blocked cells are part of the occupied mask, so one AND covers both
+        return not self._occupied_mask & (layout.mask << anchor)
+
+    def valid_positions(
+        self, shape: frozenset[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """Find every position at which a shape can currently be placed.
+
+        Equivalent to calling can_place_shape for each position on the board.
+
+        Args:
+            shape: The shape cells as a frozenset of (row_offset, col_offset) tuples
+
+        Returns:
+            List of (row, col) positions in row-major order
+        """
+        return [position for position, _ in self.valid_placements(shape)]
 
-            # Check bounds
-            if not (0 <= row < self._height and 0 <= col < self._width):
-                return False
+    def valid_placements(
+        self, shape: frozenset[tuple[int, int]]
+    ) -> list[tuple[tuple[int, int], int]]:
+        """Find every free placement of a shape along with the cells it covers.
 
-            # Check if cell is blocked (initially filled)
-            if (row, col) in self._blocked_cells:
-                return False
+        The shape mask is slid across the board instead of being located and
+        shifted from scratch for each candidate, and each mask is returned as
+        placement_mask would compute it.
 
-            # Check if cell is already occupied by a piece
-            cell_content = self._cells[row][col]
-            if cell_content is not None and cell_content != -1:
-                return False
+        Args:
+            shape: The shape cells as a frozenset of (row_offset, col_offset) tuples
 
-        return True
+        Returns:
+            List of ((row, col), mask) pairs in row-major order
+        """
+        layout = self._shape_layout(shape)
+        occupied = self._occupied_mask
+        width = self._width
+        placements: list[tuple[tuple[int, int], int]] = []
+        for row in range(layout.first_row, layout.last_row + 1):
+            mask = layout.mask << (row * width + layout.first_col + layout.shift)
+            for col in range(layout.first_col, layout.last_col + 1):
+                if not occupied & mask:
+                    placements.append(((row, col), mask))
+                mask <<= 1
+        return placements
 
     def place_shape(
         self, shape: frozenset[tuple[int, int]], position: tuple[int, int]
@@ -132,14 +310,21 @@ class GameBoard:
         Raises:
             ValueError: If shape cannot be placed at position
         """
-        if not self.can_place_shape(shape, position):
+        located = self._locate(shape, position)
+        if located is None:
             raise ValueError(f"Cannot place shape at position {position}")
 
+        layout, anchor = located
+        mask = layout.mask << anchor
+        if self._occupied_mask & mask:
+            raise ValueError(f"Cannot place shape at position {position}")
+
+        self._occupied_mask |= mask
+        self._filled_count += len(layout.offsets)
         shape_hash = hash(shape)
-        for row_offset, col_offset in shape:
-            row = position[0] + row_offset
-            col = position[1] + col_offset
-            self._cells[row][col] = shape_hash
+        cells = self._cells
+        for offset in layout.offsets:
+            cells[anchor + offset] = shape_hash
 
     def remove_shape(
         self, shape: frozenset[tuple[int, int]], position: tuple[int, int]
@@ -153,44 +338,53 @@ class GameBoard:
         Raises:
             ValueError: If shape is not found at position
         """
+        located = self._locate(shape, position)
+        if located is None:
+            raise ValueError(f"Shape not found at position {position}")
+
+        layout, anchor = located
         shape_hash = hash(shape)
-        for row_offset, col_offset in shape:
-            row = position[0] + row_offset
-            col = position[1] + col_offset
-            if self._cells[row][col] != shape_hash:
+        cells = self._cells
+        for offset in layout.offsets:
+            if cells[anchor + offset] != shape_hash:
                 raise ValueError(f"Shape not found at position {position}")
 
         # Remove the shape
-        for row_offset, col_offset in shape:
-            row = position[0] + row_offset
-            col = position[1] + col_offset
-            self._cells[row][col] = None
+        self._occupied_mask &= ~(layout.mask << anchor)
+        self._filled_count -= len(layout.offsets)
+        for offset in layout.offsets:
+            cells[anchor + offset] = None
 
-    def get_occupied_cells(self) -> set[tuple[int, int]]:
+    def get_occupied_cells(self) -> frozenset[tuple[int, int]]:
         """Get set of all occupied cell positions.
 
+        The set is decoded once per board state and reused until the board
+        changes.
+
         Returns:
-            Set of (row, col) tuples with pieces placed
+            Frozenset of (row, col) tuples with pieces placed
         """
-        return {
-            (row, col)
-            for row in range(self._height)
-            for col in range(self._width)
-            if self._cells[row][col] is not None
-        }
-
-    def get_empty_cells(self) -> set[tuple[int, int]]:
+        cache = self._occupied_cache
+        if cache is None or cache[0] != self._occupied_mask:
+            cells = frozenset(mask_to_shape(self._occupied_mask, self._width))
+            cache = self._occupied_cache = (self._occupied_mask, cells)
+        return cache[1]
+
+    def get_empty_cells(self) -> frozenset[tuple[int, int]]:
         """Get set of all empty cell positions.
 
+        The set is decoded once per board state and reused until the board
+        changes.
+
         Returns:
-            Set of (row, col) tuples without pieces
+            Frozenset of (row, col) tuples without pieces
         """
-        return {
-            (row, col)
-            for row in range(self._height)
-            for col in range(self._width)
-            if self._cells[row][col] is None
-        }
+        cache = self._empty_cache
+        if cache is None or cache[0] != self._occupied_mask:
+            empty_mask = ~self._occupied_mask & self._full_mask
+            cells = frozenset(mask_to_shape(empty_mask, self._width))
+            cache = self._empty_cache = (self._occupied_mask, cells)
+        return cache[1]
 
     def is_full(self) -> bool:
         """Check if board is completely filled.
@@ -198,11 +392,7 @@ class GameBoard:
         Returns:
             True if all cells are occupied
         """
-        return all(
-            self._cells[row][col] is not None
-            for row in range(self._height)
-            for col in range(self._width)
-        )
+        return self._occupied_mask == self._full_mask
 
     def is_empty(self) -> bool:
         """Check if the board is completely empty.
@@ -210,8 +400,8 @@ class GameBoard:
         Returns:
             True if no pieces are placed (blocked cells are ignored)
         """
-        # Check if any non-blocked cells are occupied
-        return all(cell is None or cell == -1 for row in self._cells for cell in row)
+        # Only blocked cells may be occupied
+        return self._occupied_mask == self._blocked_mask
 
     def is_blocked(self, position: tuple[int, int]) -> bool:
         """Check if a cell is blocked (initially filled).
@@ -239,17 +429,17 @@ class GameBoard:
             position: (row, col) position to query
 
         Returns:
-            Piece ID (hash) if cell is occupied, None otherwise
+            Piece ID (hash) if cell is occupied, BLOCKED_CELL if blocked,
+            None otherwise
         """
         row, col = position
-        return self._cells[row][col]
+        return self._cells[row * self._width + col]
 
     def clear(self) -> None:
         """Clear all pieces from the board."""
-        for row in range(self._height):
-            for col in range(self._width):
-                if self._cells[row][col] != -1:
-                    self._cells[row][col] = None
+        self._cells[:] = self._blank_cells
+        self._occupied_mask = self._blocked_mask
+        self._filled_count = len(self._blocked_cells)
 
     def copy(self) -> GameBoard:
         """Create a deep copy of the board.
@@ -257,8 +447,11 @@ class GameBoard:
         Returns:
             New GameBoard with identical state (including blocked cells)
         """
-        new_board = GameBoard(self._width, self._height, self._blocked_cells.copy())
-        new_board._cells = [row[:] for row in self._cells]
+        # Shallow copy shares immutable state and the shape layout cache (valid
+        # for the same dimensions); only the mutable containers are duplicated
+        new_board = copy.copy(self)
+        new_board._cells = self._cells[:]
+        new_board._blocked_cells = self._blocked_cells.copy()
         return new_board
 
     def __eq__(self, other: object) -> bool:
@@ -268,11 +461,7 @@ class GameBoard:
         return (
             self._width == other._width
             and self._height == other._height
-            and all(
-                self._cells[row][col] == other._cells[row][col]
-                for row in range(self._height)
-                for col in range(self._width)
-            )
+            and self._cells == other._cells
             and self._blocked_cells == other._blocked_cells
         )
 
@@ -2,9 +2,51 @@
 
 from __future__ import annotations
 
+from typing import NamedTuple
+
+from src.logic.rotation import orientation_masks, orientation_orbit
 from src.logic.validator import is_contiguous
 
 
+class Orientation(NamedTuple):
+    """A single precomputed orientation of a piece.
+
+    Attributes:
+        cells: Normalized cells of the orientation (min row/col = 0)
+        mask: Cells encoded as a bitmask with a row stride of ``width``
+        width: Number of columns spanned by the orientation
+        height: Number of rows spanned by the orientation
+    """
+
+    cells: frozenset[tuple[int, int]]
+    mask: int
+    width: int
+    height: int
+
+
+def _orientation_key(orientation: Orientation) -> int:
+    """Pack an orientation's cells into an int on a stride shared by its orbit.
+
+    Cells are numbered from the most significant bit down in row-major order,
+    so the largest key belongs to the lexicographically smallest orientation.
+    A shape's orbit all fits in a square of side ``max(width, height)``, and
+    the top row always holds a cell, so keys of shapes with different strides
+    fall in disjoint ranges and the key identifies the shape on its own.
+
+    Args:
+        orientation: Orientation record to encode
+
+    Returns:
+        Packed integer key
+    """
+    stride = max(orientation.width, orientation.height)
+    top = stride * stride - 1
+    key = 0
+    for row, col in orientation.cells:
+        key |= 1 << (top - row * stride - col)
+    return key
+
+
 class PuzzlePiece:
     """Represents a single polyomino piece with its shape.
 
@@ -13,11 +55,24 @@ class PuzzlePiece:
 
     Attributes:
         orientations: All unique precomputed transformations (rotations + reflections)
-        canonical_shape: Smallest normalized orientation (used for equality/hash)
+        orientation_table: The same orientations as immutable Orientation records
+        canonical_shape: Lexicographically smallest normalized orientation
         area: Number of cells in the piece
         bounding_box: Tuple of (min_row, max_row, min_col, max_col)
     """
 
+    __slots__ = (
+        "_orientation_table",
+        "_orientations",
+        "_canonical_key",
+        "_canonical_shape",
+        "_hash",
+        "_area",
+        "_width",
+        "_height",
+        "_bounding_box",
+    )
+
     def __init__(self, shape: set[tuple[int, int]]) -> None:
         """Initialize a puzzle piece.
 
@@ -33,75 +88,50 @@ class PuzzlePiece:
             raise ValueError("Shape must be contiguous (all cells connected)")
 
         # Compute all unique orientations (rotations + reflections)
-        self._orientations = self._compute_all_orientations(shape)
-        # Canonical shape = sorted smallest orientation (for equality/hash)
-        # Sort by string representation for consistent ordering across equivalent pieces
-        self._canonical_shape = min(self._orientations, key=lambda s: tuple(sorted(s)))
-        # Precomputed attributes
+        self._orientation_table = self._compute_all_orientations(shape)
+        self._orientations = frozenset(o.cells for o in self._orientation_table)
+        # Canonical shape = orientation with the extremal packed key (for
+        # equality/hash); comparing pieces then needs a single int comparison
+        canonical = max(self._orientation_table, key=_orientation_key)
+        self._canonical_key = _orientation_key(canonical)
+        self._canonical_shape = canonical.cells
+        # Pieces are immutable, so the hash is computed once
+        self._hash = hash(self._canonical_key)
+        # Precomputed attributes; the canonical orientation is normalized, so
+        # its record already holds the bounding box
         self._area = len(self._canonical_shape)
-        self._bounding_box = self._compute_bounding_box(self._canonical_shape)
+        self._width = canonical.width
+        self._height = canonical.height
+        self._bounding_box = (0, canonical.height - 1, 0, canonical.width - 1)
 
     def _compute_all_orientations(
         self, shape: set[tuple[int, int]]
-    ) -> frozenset[frozenset[tuple[int, int]]]:
+    ) -> tuple[Orientation, ...]:
         """Compute and cache all unique orientations (8 max: 4 rotations × 2 mirrors).
 
         Returns:
-            Frozenset of unique PuzzlePiece orientations (deduplicated)
+            Tuple of unique Orientation records
         """
-        orientations: set[frozenset[tuple[int, int]]] = set()
-
-        # Generate 4 rotations × 2 flips
-        current_shape = shape
-        for _ in range(4):
-            # Add original (not flipped) rotation
-            normalized = self._normalize_shape(current_shape)
-            orientations.add(frozenset(normalized))
-            # Add flipped version (horizontal flip)
-            flipped_shape = self._flip_shape(current_shape)
-            orientations.add(frozenset(self._normalize_shape(flipped_shape)))
-            # Rotate 90° for next iteration
-            current_shape = self._rotate_shape(current_shape)
-
-        return frozenset(orientations)
-
-    def _normalize_shape(self, shape: set[tuple[int, int]]) -> set[tuple[int, int]]:
-        """Shift shape so min row/col = 0."""
-        if not shape:
-            return set()
-        min_row = min(r for r, c in shape)
-        min_col = min(c for r, c in shape)
-        return {(r - min_row, c - min_col) for r, c in shape}
-
-    def _rotate_shape(self, shape: set[tuple[int, int]]) -> set[tuple[int, int]]:
-        """Rotate shape 90 degrees clockwise around origin."""
-        new_shape = {(col, -row) for row, col in shape}
-        min_row = min(row for row, _ in new_shape)
-        min_col = min(col for _, col in new_shape)
-        return {(row - min_row, col - min_col) for row, col in new_shape}
-
-    def _flip_shape(self, shape: set[tuple[int, int]]) -> set[tuple[int, int]]:
-        """Flip (mirror) shape horizontally."""
-        new_shape = {(row, -col) for row, col in shape}
-        min_row = min(row for row, _ in new_shape)
-        min_col = min(col for _, col in new_shape)
-        return {(row - min_row, col - min_col) for row, col in new_shape}
-
-    def _compute_bounding_box(
-        self, shape: frozenset[tuple[int, int]]
-    ) -> tuple[int, int, int, int]:
-        """Compute bounding box from canonical shape."""
-        min_row = min(r for r, c in shape)
-        max_row = max(r for r, c in shape)
-        min_col = min(c for r, c in shape)
-        max_col = max(c for r, c in shape)
-        return (min_row, max_row, min_col, max_col)
+        frozen = frozenset(shape)
+        # Both orbits are cached per shape and already deduplicated by mask,
+        # so the records are assembled without re-encoding any cells
+        return tuple(
+            Orientation(cells, mask, width, height)
+            for cells, (mask, width, height) in zip(
+                orientation_orbit(frozen), orientation_masks(frozen), strict=True
+            )
+        )
 
     @property
     def orientations(self) -> frozenset[frozenset[tuple[int, int]]]:
         """All unique precomputed orientations (rotations + reflections)."""
         return self._orientations
 
+    @property
+    def orientation_table(self) -> tuple[Orientation, ...]:
+        """All unique orientations as precomputed Orientation records."""
+        return self._orientation_table
+
     @property
     def canonical_shape(self) -> frozenset[tuple[int, int]]:
         """Smallest normalized orientation (used for equality/hash)."""
@@ -120,14 +150,12 @@ class PuzzlePiece:
     @property
     def width(self) -> int:
         """Piece width (max_col - min_col + 1)."""
-        _, _, min_col, max_col = self._bounding_box
-        return max_col - min_col + 1
+        return self._width
 
     @property
     def height(self) -> int:
         """Piece height (max_row - min_row + 1)."""
-        min_row, max_row, _, _ = self._bounding_box
-        return max_row - min_row + 1
+        return self._height
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another piece.
@@ -137,14 +165,14 @@ class PuzzlePiece:
         """
         if not isinstance(other, PuzzlePiece):
             return NotImplemented
-        return self._canonical_shape == other._canonical_shape
+        return self._canonical_key == other._canonical_key
 
     def __hash__(self) -> int:
         """Make piece hashable for use in sets and dicts.
 
-        Uses canonical shape so rotated/flipped versions hash the same.
+        Uses the canonical key so rotated/flipped versions hash the same.
         """
-        return hash(self._canonical_shape)
+        return self._hash
 
     def __repr__(self) -> str:
         """Get string representation."""
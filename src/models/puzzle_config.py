@@ -5,7 +5,6 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from src.logic.validator import validate_piece_shape
 from src.models.board import GameBoard
 from src.models.piece import PuzzlePiece
 
@@ -165,13 +164,10 @@ class PuzzleConfiguration:
             count: Number of copies of this piece
 
         Raises:
-            ValueError: If piece not found or shape is invalid
+            ValueError: If piece not found
         """
-        # Validate new shape
-        shape_errors = validate_piece_shape(set(piece.canonical_shape))
-        if shape_errors:
-            raise ValueError(f"Piece: {shape_errors[0].message}")
-
+        # PuzzlePiece validates its shape on construction, so only membership
+        # needs checking here
         if piece not in self._pieces:
             raise ValueError("Piece not found")
 
@@ -196,12 +192,6 @@ class PuzzleConfiguration:
             if count <= 0:
                 errors.append(f"Piece has invalid count {count}")
 
-        # Check piece contiguity using centralized validator
-        for piece in self._pieces:
-            shape_errors = validate_piece_shape(set(piece.canonical_shape))
-            for error in shape_errors:
-                errors.append(f"Piece: {error.message}")
-
         # Check total piece area vs available board area
         piece_area = self.get_total_piece_area()
         board_area = self.get_board_area()
@@ -224,15 +214,7 @@ class PuzzleConfiguration:
         Args:
             piece: Puzzle piece to add
             count: Number of copies to add (default: 1)
-
-        Raises:
-            ValueError: If piece is invalid
         """
-        # Use centralized validation
-        shape_errors = validate_piece_shape(set(piece.canonical_shape))
-        if shape_errors:
-            raise ValueError(f"Piece: {shape_errors[0].message}")
-
         # Check for duplicate shape
         if piece in self._pieces:
             self._pieces[piece] += count
@@ -383,16 +365,14 @@ class PuzzleConfiguration:
         Returns:
             New PuzzleConfiguration with identical state (including blocked cells)
         """
-        pieces_copy = {
-            PuzzlePiece(shape=set(p.canonical_shape)): count
-            for p, count in self._pieces.items()
-        }
+        # Pieces are immutable, so the copy can share them; the constructor
+        # copies the dict and the blocked-cell set
         new_config = PuzzleConfiguration(
             name=self._name,
             board_width=self._board_width,
             board_height=self._board_height,
-            pieces=pieces_copy,
-            blocked_cells=self._blocked_cells.copy(),
+            pieces=self._pieces,
+            blocked_cells=self._blocked_cells,
         )
         # Preserve timestamps
         new_config._created_at = self._created_at
@@ -205,6 +205,39 @@ class TestPuzzleConfigurationModification:
         assert config.pieces[piece] == 2
 
 
+class TestPuzzleConfigurationCopy:
+    """Test puzzle configuration copying."""
+
+    def test_copy_is_equal_and_independent(self) -> None:
+        """Test that a copy matches the original but can be modified separately."""
+        piece = PuzzlePiece(shape={(0, 0), (1, 0), (1, 1)})
+        original = PuzzleConfiguration(
+            name="Test",
+            board_width=4,
+            board_height=4,
+            pieces={piece: 2},
+            blocked_cells={(1, 1)},
+        )
+
+        copied = original.copy()
+        assert copied == original
+        assert copied.created_at == original.created_at
+
+        copied.add_piece(PuzzlePiece(shape={(0, 0)}))
+        assert original.pieces == {piece: 2}
+        assert original.blocked_cells == {(1, 1)}
+
+    def test_copy_shares_immutable_pieces(self) -> None:
+        """Test that copying reuses piece objects instead of rebuilding them."""
+        piece = PuzzlePiece(shape={(0, 0), (1, 0), (1, 1)})
+        original = PuzzleConfiguration(
+            name="Test", board_width=4, board_height=4, pieces={piece: 1}
+        )
+
+        copied_piece = next(iter(original.copy().pieces))
+        assert copied_piece is piece
+
+
 class TestPuzzleConfigurationSerialization:
     """Test puzzle configuration serialization."""
 
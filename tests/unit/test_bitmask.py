@@ -0,0 +1,53 @@
+"""Unit tests for bitmask shape encoding helpers."""
+
+from __future__ import annotations
+
+from src.logic.bitmask import flood_fill, iter_bits, mask_to_shape, shape_to_mask
+
+
+class TestShapeToMask:
+    """Test shape_to_mask function."""
+
+    def test_single_cell_at_origin(self) -> None:
+        """Test that the origin cell maps to bit 0."""
+        assert shape_to_mask({(0, 0)}, 5) == 1
+
+    def test_bits_use_row_stride(self) -> None:
+        """Test that each row is offset by the stride."""
+        mask = shape_to_mask({(0, 1), (1, 0)}, 4)
+
+        assert mask == (1 << 1) | (1 << 4)
+
+    def test_empty_shape_is_zero(self) -> None:
+        """Test that an empty shape encodes to 0."""
+        assert shape_to_mask(set(), 3) == 0
+
+
+class TestMaskToShape:
+    """Test mask_to_shape and iter_bits functions."""
+
+    def test_round_trip(self) -> None:
+        """Test that decoding an encoded shape returns the original cells."""
+        shape = {(0, 0), (1, 0), (1, 1), (2, 3)}
+
+        assert mask_to_shape(shape_to_mask(shape, 6), 6) == shape
+
+    def test_iter_bits_lowest_first(self) -> None:
+        """Test that set bits are yielded in ascending order."""
+        assert list(iter_bits(0b101001)) == [0, 3, 5]
+
+
+class TestFloodFill:
+    """Test flood_fill function."""
+
+    def test_fills_connected_region(self) -> None:
+        """Test that the fill reaches every connected cell."""
+        region = shape_to_mask({(0, 0), (0, 1), (1, 1), (2, 1)}, 3)
+
+        assert flood_fill(1, region, 3) == region
+
+    def test_stops_at_gaps(self) -> None:
+        """Test that the fill does not cross empty cells."""
+        region = shape_to_mask({(0, 0), (2, 0)}, 2)
+
+        assert flood_fill(1, region, 2) == 1
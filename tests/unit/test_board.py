@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from src.models.board import GameBoard
+from src.models.board import BLOCKED_CELL, GameBoard
 
 
 class TestGameBoardCreation:
@@ -103,6 +103,14 @@ class TestGameBoardBlockedCells:
         assert isinstance(result, set)
         assert result == blocked
 
+    def test_blocked_mask_matches_blocked_cells(self) -> None:
+        """Test that blocked_mask has one bit per blocked cell."""
+        board = GameBoard(width=4, height=3, blocked_cells={(0, 1), (2, 3)})
+
+        assert board.blocked_mask == (1 << 1) | (1 << 11)
+        board.place_shape(frozenset({(0, 0)}), (1, 1))
+        assert board.blocked_mask == (1 << 1) | (1 << 11)
+
 
 class TestGameBoardCellAccess:
     """Test GameBoard cell access methods."""
@@ -131,6 +139,7 @@ class TestGameBoardCellAccess:
         # Blocked cells return -1 (not None)
         result = board.get_piece_at((1, 1))
         assert result == -1
+        assert result == BLOCKED_CELL
 
 
 class TestGameBoardShapePlacement:
@@ -165,6 +174,14 @@ class TestGameBoardShapePlacement:
         assert board.can_place_shape(shape, (2, 2)) is False
         assert board.can_place_shape(shape, (5, 0)) is False
 
+    def test_can_place_shape_does_not_wrap_rows(self) -> None:
+        """Test that a shape crossing the right edge is not wrapped to the next row."""
+        board = GameBoard(width=3, height=3)
+        shape = frozenset({(0, 0), (0, 1)})
+
+        assert board.can_place_shape(shape, (0, 2)) is False
+        assert board.can_place_shape(shape, (0, -1)) is False
+
     def test_can_place_shape_returns_false_for_blocked_cells(self) -> None:
         """Test can_place_shape returns False if shape hits blocked cell."""
         board = GameBoard(width=3, height=3, blocked_cells={(0, 1)})
@@ -198,6 +215,60 @@ class TestGameBoardShapePlacement:
         assert (2, 2) in occupied
         assert (2, 3) in occupied
 
+    def test_valid_positions_matches_can_place_shape(self) -> None:
+        """Test that valid_positions agrees with per-position checks."""
+        board = GameBoard(width=4, height=3, blocked_cells={(1, 1)})
+        board.place_shape(frozenset({(0, 0)}), (2, 3))
+        shape = frozenset({(0, 1), (1, 0), (1, 1)})
+
+        expected = [
+            (row, col)
+            for row in range(-2, 5)
+            for col in range(-2, 6)
+            if board.can_place_shape(shape, (row, col))
+        ]
+        assert board.valid_positions(shape) == expected
+        assert expected
+
+    def test_valid_positions_empty_when_shape_too_large(self) -> None:
+        """Test that a shape larger than the board has no positions."""
+        board = GameBoard(width=2, height=2)
+        shape = frozenset({(0, 0), (0, 1), (0, 2)})
+
+        assert board.valid_positions(shape) == []
+
+    def test_valid_placements_pair_positions_with_masks(self) -> None:
+        """Test that valid_placements masks match placement_mask."""
+        board = GameBoard(width=4, height=3, blocked_cells={(1, 1)})
+        shape = frozenset({(0, 0), (0, 1)})
+
+        placements = board.valid_placements(shape)
+
+        assert [position for position, _ in placements] == board.valid_positions(shape)
+        for position, mask in placements:
+            assert mask == board.placement_mask(shape, position)
+
+    def test_placement_mask_matches_occupied_mask(self) -> None:
+        """Test that a placement mask is the occupancy the placement adds."""
+        board = GameBoard(width=4, height=3, blocked_cells={(0, 0)})
+        shape = frozenset({(0, 1), (1, 0), (1, 1)})
+
+        mask = board.placement_mask(shape, (1, 2))
+        before = board.occupied_mask
+        board.place_shape(shape, (1, 2))
+
+        assert mask is not None
+        assert not mask & before
+        assert board.occupied_mask == before | mask
+
+    def test_placement_mask_none_out_of_bounds(self) -> None:
+        """Test that placement_mask rejects placements leaving the board."""
+        board = GameBoard(width=3, height=3)
+        shape = frozenset({(0, 0), (0, 1)})
+
+        assert board.placement_mask(shape, (0, 2)) is None
+        assert board.placement_mask(shape, (-1, 0)) is None
+
     def test_place_shape_raises_for_invalid_placement(self) -> None:
         """Test that place_shape raises ValueError for invalid placement."""
         board = GameBoard(width=3, height=3)
@@ -234,6 +305,22 @@ class TestGameBoardShapeRemoval:
         with pytest.raises(ValueError, match="not found"):
             board.remove_shape(shape, (0, 0))
 
+    def test_cell_sets_are_reused_until_board_changes(self) -> None:
+        """Test that decoded cell sets are cached and refreshed on mutation."""
+        board = GameBoard(width=3, height=3)
+        shape = frozenset({(0, 0), (0, 1)})
+
+        board.place_shape(shape, (1, 1))
+        occupied = board.get_occupied_cells()
+        empty = board.get_empty_cells()
+        assert board.get_occupied_cells() is occupied
+        assert board.get_empty_cells() is empty
+
+        board.remove_shape(shape, (1, 1))
+        assert board.get_occupied_cells() == frozenset()
+        assert len(board.get_empty_cells()) == 9
+        assert occupied == {(1, 1), (1, 2)}
+
     def test_remove_shape_restores_cells(self) -> None:
         """Test that remove_shape properly restores cells."""
         board = GameBoard(width=5, height=5)
@@ -316,6 +403,20 @@ class TestGameBoardCopy:
         assert piece_id is not None
         assert copied.get_piece_at((1, 1)) is None
 
+    def test_copy_is_independent_after_clear(self) -> None:
+        """Test that clearing the original does not affect the copy."""
+        board = GameBoard(width=3, height=3, blocked_cells={(2, 2)})
+        shape = frozenset({(0, 0), (0, 1)})
+        board.place_shape(shape, (0, 0))
+
+        copied = board.copy()
+        board.clear()
+
+        assert copied.get_piece_at((0, 0)) is not None
+        assert copied.filled_area == 3
+        assert board.is_empty() is True
+        assert board.is_blocked((2, 2)) is True
+
     def test_copy_preserves_blocked_cells(self) -> None:
         """Test that copy preserves blocked cells."""
         board = GameBoard(width=5, height=5, blocked_cells={(2, 2)})
@@ -353,3 +454,18 @@ class TestGameBoardFilledArea:
 
         # 3 cells placed, 1 blocked = 12 empty
         assert board.empty_area == 12
+
+    def test_area_counts_follow_remove_and_clear(self) -> None:
+        """Test filled/empty areas after removing shapes and clearing."""
+        board = GameBoard(width=4, height=4, blocked_cells={(3, 3)})
+        shape = frozenset({(0, 0), (0, 1), (0, 2)})
+
+        board.place_shape(shape, (0, 0))
+        board.place_shape(shape, (1, 0))
+        board.remove_shape(shape, (0, 0))
+        assert board.filled_area == 4
+        assert board.empty_area == 12
+
+        board.clear()
+        assert board.filled_area == 1
+        assert board.empty_area == 15
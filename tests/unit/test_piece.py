@@ -62,6 +62,17 @@ class TestPuzzlePieceProperties:
         assert min_col == 0
         assert max_col == 1
 
+    def test_bounding_box_matches_canonical_shape(self) -> None:
+        """Test that the cached bounding box spans the canonical shape."""
+        shape = {(0, 1), (1, 0), (1, 1), (1, 2), (2, 1)}  # X-pentomino
+        piece = PuzzlePiece(shape=shape)
+
+        rows = [r for r, _ in piece.canonical_shape]
+        cols = [c for _, c in piece.canonical_shape]
+        assert piece.bounding_box == (min(rows), max(rows), min(cols), max(cols))
+        assert piece.width == max(cols) + 1
+        assert piece.height == max(rows) + 1
+
     def test_width_property(self) -> None:
         """Test width property calculation."""
         shape = {(0, 0), (0, 1), (0, 2)}  # 3 cells wide
@@ -116,6 +127,34 @@ class TestPuzzlePieceOrientations:
         assert len(square.orientations) <= len(l_piece.orientations)
         assert len(line.orientations) <= len(l_piece.orientations)
 
+    def test_orientation_table_matches_orientations(self) -> None:
+        """Test that orientation records cover the same shapes as orientations."""
+        shape = {(0, 0), (1, 0), (1, 1), (1, 2)}
+        piece = PuzzlePiece(shape=shape)
+
+        table = piece.orientation_table
+        assert isinstance(table, tuple)
+        assert frozenset(o.cells for o in table) == piece.orientations
+        assert len(table) == len(piece.orientations)
+
+    def test_orientation_record_fields(self) -> None:
+        """Test that orientation records carry size and mask."""
+        shape = {(0, 1), (1, 0), (1, 1)}
+        piece = PuzzlePiece(shape=shape)
+
+        for orientation in piece.orientation_table:
+            assert orientation.width == max(c for _, c in orientation.cells) + 1
+            assert orientation.height == max(r for r, _ in orientation.cells) + 1
+            assert orientation.mask.bit_count() == 3
+
+    def test_canonical_shape_is_lexicographically_smallest(self) -> None:
+        """Test that the canonical shape is the smallest orientation when sorted."""
+        shape = {(0, 0), (0, 1), (1, 1), (1, 2), (2, 2)}  # W-pentomino
+        piece = PuzzlePiece(shape=shape)
+
+        expected = min(piece.orientations, key=lambda s: tuple(sorted(s)))
+        assert piece.canonical_shape == expected
+
     def test_canonical_shape_is_in_orientations(self) -> None:
         """Test that canonical shape is one of the orientations."""
         shape = {(0, 0), (1, 0), (1, 1)}
@@ -158,6 +197,20 @@ class TestPuzzlePieceEquality:
         assert piece1 == piece2
         assert hash(piece1) == hash(piece2)
 
+    def test_pieces_with_different_strides_are_unequal(self) -> None:
+        """Test that identity keys of differently sized shapes never collide."""
+        shapes = [
+            {(0, 0)},
+            {(0, 0), (0, 1)},
+            {(0, 0), (0, 1), (1, 0)},
+            {(0, 0), (0, 1), (0, 2)},
+            {(0, 0), (0, 1), (1, 0), (1, 1)},
+            {(0, 0), (0, 1), (0, 2), (0, 3)},
+        ]
+        pieces = [PuzzlePiece(shape=shape) for shape in shapes]
+
+        assert len(set(pieces)) == len(shapes)
+
     def test_unequal_pieces(self) -> None:
         """Test that different shapes are not equal."""
         shape1 = {(0, 0), (1, 0), (1, 1)}  # L shape
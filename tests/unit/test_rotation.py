@@ -8,6 +8,13 @@ from src.logic.rotation import (
     rotate_shape,
     flip_shape,
     get_all_orientations,
+    get_unique_rotations,
+    orientation_masks,
+    orientation_orbit,
+    shape_from_string,
+    shape_to_string,
+    transform_permutation,
+    TRANSFORMS,
 )
 
 
@@ -180,6 +187,30 @@ class TestGetAllOrientations:
         # Square should have fewer orientations than L
         assert len(square_orientations) < len(l_orientations)
 
+    def test_chiral_shape_has_eight_orientations(self) -> None:
+        """Test that a shape without symmetry yields all 8 D4 orientations."""
+        l_shape = {(0, 0), (1, 0), (1, 1), (1, 2)}
+        orientations = get_all_orientations(l_shape)
+
+        assert len(orientations) == 8
+
+    def test_first_orientation_is_input_shape(self) -> None:
+        """Test that the identity transform comes first."""
+        shape = {(0, 0), (1, 0), (1, 1), (1, 2)}
+        orientations = get_all_orientations(shape)
+
+        assert orientations[0] == shape
+
+    def test_first_orientation_keeps_input_offset(self) -> None:
+        """Test that the input comes back unnormalized and the rest are not."""
+        shape = {(5, 5), (5, 6), (6, 5)}
+        orientations = get_all_orientations(shape)
+
+        assert orientations[0] == shape
+        for orientation in orientations[1:]:
+            assert min(row for row, _ in orientation) == 0
+            assert min(col for _, col in orientation) == 0
+
     def test_all_orientations_normalized(self) -> None:
         """Test that all orientations have same relative structure."""
         shape = {(5, 5), (5, 6), (6, 5)}
@@ -199,3 +230,138 @@ class TestGetAllOrientations:
         unique_sets = list(set(orientation_sets))
 
         assert len(orientation_sets) == len(unique_sets)
+
+
+class TestGetUniqueRotations:
+    """Test get_unique_rotations function."""
+
+    def test_asymmetric_shape_has_four_rotations(self) -> None:
+        """Test that an L shape has four distinct rotations."""
+        shape = {(0, 0), (1, 0), (1, 1), (1, 2)}
+        rotations = get_unique_rotations(shape)
+
+        assert len(rotations) == 4
+        assert rotations[0] == shape
+        assert rotate_shape(shape, 90) in rotations
+
+    def test_first_rotation_keeps_input_offset(self) -> None:
+        """Test that the unrotated input comes back unnormalized."""
+        shape = {(2, 3), (2, 4), (3, 4)}
+        rotations = get_unique_rotations(shape)
+
+        assert rotations[0] == shape
+        assert rotations[1] == {(0, 1), (1, 0), (1, 1)}
+
+    def test_symmetric_shapes_have_fewer_rotations(self) -> None:
+        """Test that rotational symmetry collapses duplicate rotations."""
+        assert len(get_unique_rotations({(0, 0), (0, 1), (1, 0), (1, 1)})) == 1
+        assert len(get_unique_rotations({(0, 0), (0, 1), (0, 2)})) == 2
+
+    def test_excludes_reflections(self) -> None:
+        """Test that mirror images are not counted as rotations."""
+        shape = {(0, 0), (1, 0), (1, 1), (1, 2)}
+
+        assert flip_shape(shape, "horizontal") not in get_unique_rotations(shape)
+
+
+class TestOrientationOrbit:
+    """Test orientation_orbit function."""
+
+    def test_returns_tuple_of_frozensets(self) -> None:
+        """Test that the orbit is immutable."""
+        orbit = orientation_orbit(frozenset({(0, 0), (1, 0), (1, 1)}))
+
+        assert isinstance(orbit, tuple)
+        assert all(isinstance(o, frozenset) for o in orbit)
+
+    def test_translated_shapes_share_cached_orbit(self) -> None:
+        """Test that translations of a shape reuse the same cached result."""
+        orbit1 = orientation_orbit(frozenset({(0, 0), (1, 0), (1, 1)}))
+        orbit2 = orientation_orbit(frozenset({(4, 2), (5, 2), (5, 3)}))
+
+        assert orbit1 is orbit2
+
+    def test_masks_line_up_with_orbit(self) -> None:
+        """Test that each packed mask encodes the matching orbit entry."""
+        shape = frozenset({(0, 0), (1, 0), (1, 1), (1, 2)})
+        masks = orientation_masks(shape)
+        orbit = orientation_orbit(shape)
+
+        assert len(masks) == len(orbit) == 8
+        for (mask, width, height), cells in zip(masks, orbit, strict=True):
+            assert width == max(c for _, c in cells) + 1
+            assert height == max(r for r, _ in cells) + 1
+            assert mask == sum(1 << (r * width + c) for r, c in cells)
+
+    def test_get_all_orientations_returns_fresh_sets(self) -> None:
+        """Test that callers can mutate results without touching the cache."""
+        shape = {(0, 0), (0, 1)}
+        get_all_orientations(shape)[0].add((9, 9))
+
+        assert (9, 9) not in get_all_orientations(shape)[0]
+
+
+class TestTransformPermutation:
+    """Test transform_permutation function."""
+
+    def test_identity_keeps_every_bit(self) -> None:
+        """Test that the identity transform is the identity permutation."""
+        new_width, permutation = transform_permutation(2, 3, TRANSFORMS[0])
+
+        assert new_width == 3
+        assert permutation == tuple(range(6))
+
+    def test_quarter_turn_swaps_box_dimensions(self) -> None:
+        """Test that a 90 degree rotation of a 2x3 box yields a 3x2 box."""
+        new_width, permutation = transform_permutation(2, 3, TRANSFORMS[1])
+
+        assert new_width == 2
+        assert sorted(permutation) == list(range(6))
+
+    def test_tables_are_shared_per_box_size(self) -> None:
+        """Test that the same box size and transform reuse one cached table."""
+        first = transform_permutation(3, 2, TRANSFORMS[5])
+        second = transform_permutation(3, 2, TRANSFORMS[5])
+
+        assert first is second
+
+    def test_matches_rotate_shape(self) -> None:
+        """Test that moving bits agrees with rotating cells."""
+        shape = {(0, 0), (1, 0), (1, 1), (1, 2)}
+        new_width, permutation = transform_permutation(2, 3, TRANSFORMS[1])
+
+        moved = {divmod(permutation[row * 3 + col], new_width) for row, col in shape}
+        assert moved == rotate_shape(shape, 90)
+
+
+class TestShapeFromString:
+    """Test shape_from_string function."""
+
+    def test_parses_braced_tuples(self) -> None:
+        """Test parsing the format produced by shape_to_string."""
+        shape = {(0, 0), (0, 1), (1, 1)}
+
+        assert shape_from_string(shape_to_string(shape)) == shape
+
+    def test_parses_space_separated_pairs(self) -> None:
+        """Test parsing space-separated row,col pairs."""
+        assert shape_from_string("0,0 0,1 1,1") == {(0, 0), (0, 1), (1, 1)}
+
+    def test_parses_negative_coordinates(self) -> None:
+        """Test parsing negative coordinates."""
+        assert shape_from_string("{(-1, 0), ( 2 , -3 )}") == {(-1, 0), (2, -3)}
+
+    def test_empty_string_returns_empty_set(self) -> None:
+        """Test that empty input gives an empty shape."""
+        assert shape_from_string("{}") == set()
+
+    def test_skips_tokens_that_are_not_a_single_pair(self) -> None:
+        """Test that a token with extra coordinates is not truncated to a pair."""
+        assert shape_from_string("1,2,3") == set()
+        assert shape_from_string("0,0 1,2,3 a,b 1,1") == {(0, 0), (1, 1)}
+
+    def test_ignores_bare_pairs_after_tuples(self) -> None:
+        """Test that trailing text after braced tuples adds no cells."""
+        shape = shape_from_string("{(0,0),(0,1)} extra 5,5")
+
+        assert shape == {(0, 0), (0, 1)}
@@ -6,6 +6,8 @@ yield format for visualization purposes.
 
 from __future__ import annotations
 
+from itertools import pairwise
+
 import pytest
 
 from src.models.piece import PuzzlePiece
@@ -258,6 +260,80 @@ class TestBacktrackingBehavior:
             f"Should place all 6 dominoes, got {len(place_yields)}"
         )
 
+    def test_failed_states_are_not_searched_again(self) -> None:
+        """Test that a dead-end state reached twice is undone immediately."""
+        from src.logic.solver import solve_backtracking
+
+        # Opposite corners removed: dominoes can never tile this board, and
+        # different placement orders reach the same partial coverings
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        board = GameBoard(width=6, height=6, blocked_cells={(0, 0), (5, 5)})
+
+        events = [
+            (event["type"], board.occupied_mask)
+            for event in solve_backtracking({domino: 17}, board)
+        ]
+
+        assert events[-1][0] == "no_solution"
+        seen: set[int] = set()
+        revisits = 0
+        for (kind, occupied), (next_kind, _) in pairwise(events):
+            if kind != "place":
+                continue
+            if occupied in seen:
+                revisits += 1
+                assert next_kind == "remove"
+            seen.add(occupied)
+        assert revisits > 0
+
+    def test_failed_state_memo_is_bounded(self) -> None:
+        """Test that the dead-end memo never holds more than its limit."""
+        from src.logic.solver import _FailedStates
+
+        memo = _FailedStates(limit=3)
+        for state in range(10):
+            memo.add((state, ()))
+            assert len(memo) <= 3
+
+        assert (9, ()) in memo
+        assert (0, ()) not in memo
+
+    def test_search_respects_failed_state_limit(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a capped memo bounds memory without changing the result."""
+        from src.logic import solver
+
+        sizes: list[int] = []
+
+        class RecordingFailedStates(solver._FailedStates):
+            def add(self, state: tuple[int, tuple[int, ...]]) -> None:
+                super().add(state)
+                sizes.append(len(self))
+
+        monkeypatch.setattr(solver, "MAX_FAILED_STATES", 4)
+        monkeypatch.setattr(solver, "_FailedStates", RecordingFailedStates)
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        board = GameBoard(width=6, height=6, blocked_cells={(0, 0), (5, 5)})
+
+        yields = list(solver.solve_backtracking({domino: 17}, board))
+
+        assert yields[-1]["type"] == "no_solution"
+        assert len(sizes) > 4
+        assert max(sizes) <= 4
+
+    def test_unfillable_cell_fails_before_any_placement(self) -> None:
+        """Test that the most constrained cell is branched on first."""
+        from src.logic.solver import solve_backtracking
+
+        # The bottom-right corner is walled off, so no domino can cover it
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        board = GameBoard(width=3, height=3, blocked_cells={(1, 2), (2, 1)})
+
+        yields = list(solve_backtracking({domino: 3}, board))
+
+        assert [y["type"] for y in yields] == ["no_solution"]
+
     def test_all_orientations_tried(self) -> None:
         """Test that the solver explores different board positions."""
         from src.logic.solver import solve_backtracking
@@ -295,6 +371,47 @@ class TestBacktrackingBehavior:
         assert yields[0]["type"] == "solved"
 
 
+class TestYieldSteps:
+    """Tests for running the solver without per-step events."""
+
+    def test_only_final_event_is_yielded(self) -> None:
+        """Test that yield_steps=False skips place/remove events."""
+        from src.logic.solver import solve_backtracking
+
+        l_tromino = PuzzlePiece(shape={(0, 0), (1, 0), (1, 1)})
+        board = GameBoard(width=3, height=2)
+
+        yields = list(solve_backtracking({l_tromino: 2}, board, yield_steps=False))
+
+        assert [y["type"] for y in yields] == ["solved"]
+        assert board.is_full()
+
+    def test_step_count_matches_stepped_run(self) -> None:
+        """Test that the final step count is unaffected by skipping events."""
+        from src.logic.solver import solve_backtracking
+
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        stepped = list(solve_backtracking({domino: 3}, GameBoard(width=3, height=2)))
+        quiet = list(
+            solve_backtracking(
+                {domino: 3}, GameBoard(width=3, height=2), yield_steps=False
+            )
+        )
+
+        assert quiet[-1]["step_count"] == stepped[-1]["step_count"]
+
+    def test_no_solution_is_still_reported(self) -> None:
+        """Test that an unsolvable puzzle still yields no_solution."""
+        from src.logic.solver import solve_backtracking
+
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        board = GameBoard(width=3, height=1)
+
+        yields = list(solve_backtracking({domino: 2}, board, yield_steps=False))
+
+        assert [y["type"] for y in yields] == ["no_solution"]
+
+
 class TestGeneratorEdgeCases:
     """Tests for edge cases in the generator."""
 
@@ -348,6 +465,22 @@ class TestGeneratorEdgeCases:
         # Note: 4 L-tetrominoes can tile a 4x4 board
         assert last_yield["type"] in ("solved", "no_solution")
 
+    def test_search_deeper_than_recursion_limit(self) -> None:
+        """Test that search depth is not bounded by Python's recursion limit."""
+        import sys
+
+        from src.logic.solver import solve_backtracking
+
+        # One placement per cell: 2500 levels deep on a 50x50 board
+        monomino = PuzzlePiece(shape={(0, 0)})
+        board = GameBoard(width=50, height=50)
+        assert board.width * board.height > sys.getrecursionlimit()
+
+        yields = list(solve_backtracking({monomino: 2500}, board, yield_steps=False))
+
+        assert yields[-1]["type"] == "solved"
+        assert len(yields[-1]["placed_pieces"]) == 2500
+
 
 class TestStopIterationHandling:
     """Tests for StopIteration handling and termination."""
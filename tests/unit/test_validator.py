@@ -9,6 +9,7 @@ from src.logic.validator import (
     validate_piece_shape,
     validate_piece_placement,
     validate_puzzle_config,
+    placement_ok,
     is_contiguous,
     find_connected_components,
 )
@@ -47,11 +48,25 @@ class TestIsContiguous:
         shape = {(0, 0), (0, 1), (5, 5), (5, 6)}  # Two far apart
         assert is_contiguous(shape) is False
 
+    def test_row_end_does_not_touch_next_row_start(self) -> None:
+        """Test that the last cell of a row is not adjacent to the next row's first."""
+        shape = {(0, 2), (1, 0)}
+        assert is_contiguous(shape) is False
+
+    def test_negative_coordinates(self) -> None:
+        """Test that shapes with negative coordinates are handled."""
+        shape = {(-1, -1), (-1, 0), (0, 0)}
+        assert is_contiguous(shape) is True
+
     def test_empty_shape_is_contiguous(self) -> None:
         """Test that empty shape is considered contiguous (vacuously true)."""
         # Empty set has no disconnected cells
         assert is_contiguous(set()) is True
 
+    def test_far_apart_cells_are_not_contiguous(self) -> None:
+        """Test that distant cells are rejected without rasterizing their span."""
+        assert is_contiguous({(0, 0), (100000, 100000)}) is False
+
 
 class TestFindConnectedComponents:
     """Test find_connected_components function."""
@@ -70,6 +85,20 @@ class TestFindConnectedComponents:
 
         assert len(components) == 2
 
+    def test_components_keep_original_coordinates(self) -> None:
+        """Test that components contain the original cell coordinates."""
+        shape = {(2, 3), (2, 4), (6, -1)}
+        components = find_connected_components(shape)
+
+        assert sorted(components, key=len) == [{(6, -1)}, {(2, 3), (2, 4)}]
+
+    def test_far_apart_cells_are_separate_components(self) -> None:
+        """Test that a sparse shape falls back to searching the cell set."""
+        shape = {(0, 0), (0, 1), (100000, 100000)}
+        components = find_connected_components(shape)
+
+        assert sorted(components, key=len) == [{(100000, 100000)}, {(0, 0), (0, 1)}]
+
     def test_empty_shape_has_no_components(self) -> None:
         """Test that empty shape has no components."""
         components = find_connected_components(set())
@@ -153,6 +182,44 @@ class TestValidatePieceShape:
         assert errors[0].error_type == "NON_CONTIGUOUS"
 
 
+class TestPlacementOk:
+    """Test placement_ok function."""
+
+    def test_valid_placement_returns_true(self) -> None:
+        """Test that a placement inside the board with free cells is accepted."""
+        piece_shape = {(0, 0), (1, 0), (1, 1)}
+
+        assert placement_ok(piece_shape, 5, 5, (0, 0)) is True
+
+    def test_out_of_bounds_returns_false(self) -> None:
+        """Test that a placement leaving the board is rejected."""
+        piece_shape = {(0, 0), (1, 0), (1, 1)}
+
+        assert placement_ok(piece_shape, 3, 3, (2, 2)) is False
+        assert placement_ok(piece_shape, 3, 3, (-1, 0)) is False
+
+    def test_overlap_returns_false(self) -> None:
+        """Test that a placement over occupied cells is rejected."""
+        piece_shape = {(0, 0), (1, 0)}
+
+        assert placement_ok(piece_shape, 5, 5, (0, 0), {(1, 0)}) is False
+        assert placement_ok(piece_shape, 5, 5, (0, 1), {(1, 0)}) is True
+
+    def test_agrees_with_validate_piece_placement(self) -> None:
+        """Test that the fast path matches the detailed validator."""
+        piece_shape = {(0, 0), (0, 1), (1, 1)}
+        occupied = {(1, 2), (2, 0)}
+
+        for row in range(-1, 4):
+            for col in range(-1, 4):
+                errors = validate_piece_placement(
+                    piece_shape, 3, 3, (row, col), occupied
+                )
+                assert placement_ok(piece_shape, 3, 3, (row, col), occupied) is (
+                    not errors
+                )
+
+
 class TestValidatePiecePlacement:
     """Test validate_piece_placement function."""
 